@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Automation Benchmark
+Measures how parsing and issue creation scale with plan size
+
+Generates synthetic sprint_N_*.md plans in the format the sprint parser
+expects, then times parsing, description generation, payload
+construction and an end-to-end run against a local fake Jira endpoint.
+Results are written as JSON so runs can be compared over time.
+
+Usage:
+    python3 benchmark_automation.py --sizes 10,1000,10000 --output bench.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import itertools
+import tempfile
+import threading
+import contextlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+# The benchmark must never be throttled by the adaptive limiter
+os.environ.setdefault('RATE_LIMIT_DELAY', '0')
+os.environ.setdefault('RATE_LIMIT_MAX_RPS', '1000000')
+os.environ['SPRINT_CACHE'] = 'false'
+
+from eaio_jira_automation import EAIOJiraAutomation
+
+
+def synthetic_task_block(sprint_number: int, task_number: int) -> str:
+    """Markdown block for one synthetic task, header included"""
+    task_id = f"T{sprint_number}.{task_number:03d}"
+    dependencies = f"T{sprint_number}.{task_number - 1:03d}" if task_number > 1 else "None"
+    return (
+        f"**{task_id}** - Synthetic task {task_number} for sprint {sprint_number}\n"
+        f"- **Story Points**: {(task_number % 5) * 2 + 1}\n"
+        f"- **Assignee**: Backend Developer + DevOps Engineer\n"
+        f"- **Duration**: {task_number % 4 + 1} days\n"
+        f"- **Dependencies**: {dependencies}\n"
+        f"- **Architecture Reference**: `.cursor/architecture/data/physical_model.md` - Synthetic reference\n"
+        f"- **Acceptance Criteria**:\n"
+        f"  - [ ] Component {task_number} implemented and reviewed\n"
+        f"  - [ ] Unit tests cover the main paths\n"
+        f"  - [ ] Documentation updated for sprint {sprint_number}\n"
+        f"\n"
+    )
+
+
+def generate_sprint_plan(directory: Path, total_tasks: int, tasks_per_sprint: int = 200,
+                         epics_per_sprint: int = 5) -> List[Path]:
+    """Write a synthetic plan of ``total_tasks`` tasks as sprint_N_synthetic.md files"""
+    directory.mkdir(parents=True, exist_ok=True)
+    sprint_files = []
+    remaining = total_tasks
+
+    for sprint_number in itertools.count(1):
+        if remaining <= 0:
+            break
+        sprint_tasks = min(tasks_per_sprint, remaining)
+        remaining -= sprint_tasks
+        epic_count = max(1, min(epics_per_sprint, sprint_tasks))
+
+        parts = [
+            f"# Sprint {sprint_number}: Synthetic Sprint {sprint_number}\n",
+            "**Development Mode (T.*) - Benchmark Focus**\n\n",
+            "## 🎯 Sprint Overview\n\n",
+            "**Duration**: 14 days (Weeks 1-2)  \n",
+            "**Focus**: Synthetic Layer with generated benchmark tasks  \n",
+            f"**Story Points Target**: {sprint_tasks * 5} points\n\n",
+            "---\n\n",
+            "## 📋 Sprint Backlog\n\n",
+        ]
+        task_number = 1
+        for epic_number in range(1, epic_count + 1):
+            epic_tasks = sprint_tasks // epic_count + (1 if epic_number <= sprint_tasks % epic_count else 0)
+            parts.append(f"### Epic {epic_number}: Synthetic Epic {sprint_number}.{epic_number}\n")
+            parts.append(f"**Goal**: Generated goal for epic {epic_number} of sprint {sprint_number}\n\n")
+            for _ in range(epic_tasks):
+                parts.append(synthetic_task_block(sprint_number, task_number))
+                task_number += 1
+
+        sprint_file = directory / f"sprint_{sprint_number}_synthetic.md"
+        sprint_file.write_text("".join(parts), encoding='utf-8')
+        sprint_files.append(sprint_file)
+
+    return sprint_files
+
+
+class FakeJiraServer:
+    """Local Jira stand-in answering issue creation with fresh keys"""
+
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        """Initialize with the port (0 = any free port) and per-request latency"""
+        self.port = port
+        self.latency = latency
+        self.requests = 0
+        self.bytes_received = 0
+        self._keys = itertools.count(1)
+        self._loop = asyncio.new_event_loop()
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    async def _respond(self, request: web.Request) -> bytes:
+        """Account for a request and apply the simulated latency"""
+        body = await request.read()
+        self.requests += 1
+        self.bytes_received += len(body)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return body
+
+    async def _create_issue(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.json_response({'key': f"BENCH-{next(self._keys)}"}, status=201)
+
+    async def _create_bulk(self, request: web.Request) -> web.Response:
+        body = json.loads(await self._respond(request))
+        issues = [{'key': f"BENCH-{next(self._keys)}"} for _ in body['issueUpdates']]
+        return web.json_response({'issues': issues, 'errors': []}, status=201)
+
+    async def _update_issue(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.Response(status=204)
+
+    async def _create_link(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.Response(status=201)
+
+    async def _fields(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.json_response([
+            {'id': 'summary', 'name': 'Summary', 'custom': False},
+            {'id': 'customfield_10016', 'name': 'Story point estimate', 'custom': True},
+        ])
+
+    async def _issue_types(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        issue_types = [{'id': '10001', 'name': 'Task'}, {'id': '10000', 'name': 'Epic'}]
+        return web.json_response({'issueTypes': issue_types, 'total': len(issue_types)})
+
+    async def _create_fields(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        field_ids = ['summary', 'description', 'issuetype', 'project']
+        if request.match_info['type_id'] == '10001':
+            field_ids += ['parent', 'customfield_10016']
+        return web.json_response({'fields': [{'fieldId': field_id} for field_id in field_ids], 'total': len(field_ids)})
+
+    async def _search(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.json_response({'issues': [], 'isLast': True})
+
+    async def _myself(self, request: web.Request) -> web.Response:
+        await self._respond(request)
+        return web.json_response({'displayName': 'Benchmark'})
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL"""
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post('/rest/api/3/issue', self._create_issue)
+        app.router.add_post('/rest/api/3/issue/bulk', self._create_bulk)
+        app.router.add_put('/rest/api/3/issue/{key}', self._update_issue)
+        app.router.add_post('/rest/api/3/issueLink', self._create_link)
+        app.router.add_get('/rest/api/3/myself', self._myself)
+        app.router.add_get('/rest/api/3/field', self._fields)
+        app.router.add_post('/rest/api/3/search/jql', self._search)
+        app.router.add_get('/rest/api/3/issue/createmeta/{project}/issuetypes', self._issue_types)
+        app.router.add_get('/rest/api/3/issue/createmeta/{project}/issuetypes/{type_id}', self._create_fields)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        self._loop.run_until_complete(web.TCPSite(self._runner, '127.0.0.1', self.port).start())
+        self.port = self._runner.addresses[0][1]
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return f"http://127.0.0.1:{self.port}"
+
+    def stop(self):
+        """Close open connections and handlers on the server loop, then stop it"""
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._runner = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._loop.close()
+
+
+def _timed(func, *args):
+    """Run func with its console output suppressed and return (result, seconds)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_size(total_tasks: int, args: argparse.Namespace, base_url: str, server: FakeJiraServer) -> Dict:
+    """Benchmark one plan size"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sprints_dir = Path(temp_dir) / "sprints"
+        sprint_files = generate_sprint_plan(sprints_dir, total_tasks, args.tasks_per_sprint, args.epics_per_sprint)
+        plan_bytes = sum(f.stat().st_size for f in sprint_files)
+
+        automation = EAIOJiraAutomation(
+            base_url, "bench@example.com", "token", "BENCH",
+            async_client=args.async_client, max_concurrency=args.concurrency, bulk_create=args.bulk,
+            pipeline=args.pipeline, thread_pool=args.threads
+        )
+
+        # Parsing
+        sprints, parse_seconds = _timed(lambda: [automation.parse_sprint_file(f) for f in sprint_files])
+        tasks = [task for sprint in sprints for epic in sprint.epics for task in epic.tasks]
+
+        # Description generation on the raw task blocks
+        raw_blocks = [
+            synthetic_task_block(1, number).split("\n", 1)[1] for number in range(1, len(tasks) + 1)
+        ]
+        _, description_seconds = _timed(lambda: [
+            automation._generate_task_description(
+                block, "Synthetic Epic", "Synthetic Sprint", ["T1.001"], ["Criterion"]
+            )
+            for block in raw_blocks
+        ])
+
+        # Payload construction and serialization
+        _, payload_seconds = _timed(lambda: [
+            json.dumps(automation.jira_client._build_task_payload(task, "BENCH-0")) for task in tasks
+        ])
+
+        result = {
+            'tasks': len(tasks),
+            'sprint_files': len(sprint_files),
+            'plan_bytes': plan_bytes,
+            'parse_seconds': parse_seconds,
+            'parse_tasks_per_second': len(tasks) / parse_seconds if parse_seconds else None,
+            'description_seconds': description_seconds,
+            'payload_seconds': payload_seconds,
+            'e2e_seconds': None,
+            'e2e_requests': None,
+            'e2e_issues_per_second': None,
+        }
+
+        # End-to-end creation against the fake endpoint
+        if total_tasks <= args.e2e_max_tasks:
+            requests_before = server.requests
+
+            async def run():
+                try:
+                    await automation.process_all_sprints(str(sprints_dir))
+                finally:
+                    await automation.close()
+
+            _, e2e_seconds = _timed(lambda: asyncio.run(run()))
+            issues = automation.stats['epics_created'] + automation.stats['tasks_created']
+            result.update({
+                'e2e_seconds': e2e_seconds,
+                'e2e_requests': server.requests - requests_before,
+                'e2e_issues_per_second': issues / e2e_seconds if e2e_seconds else None,
+                'e2e_stats': dict(automation.stats),
+                'e2e_metrics': automation.metrics.snapshot(),
+            })
+        else:
+            asyncio.run(automation.close())
+
+        return result
+
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="EAIO Jira Automation Benchmark")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma-separated plan sizes in tasks")
+    parser.add_argument("--tasks-per-sprint", type=int, default=200, help="Tasks per generated sprint file")
+    parser.add_argument("--epics-per-sprint", type=int, default=5, help="Epics per generated sprint file")
+    parser.add_argument("--e2e-max-tasks", type=int, default=10000, help="Largest size to run end-to-end")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated Jira latency per request (seconds)")
+    parser.add_argument("--async-client", action="store_true", help="Use the pooled aiohttp client")
+    parser.add_argument("--threads", action="store_true", help="Run the blocking client on a thread pool")
+    parser.add_argument("--concurrency", type=int, help="Maximum in-flight requests for the async client or thread pool")
+    parser.add_argument("--bulk", action="store_true", help="Create tasks with bulk requests")
+    parser.add_argument("--pipeline", action="store_true", help="Stream issues to Jira while parsing")
+    parser.add_argument("--generate", metavar="DIR", help="Only write a synthetic plan of the first size to DIR")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    if args.generate:
+        sprint_files = generate_sprint_plan(Path(args.generate), sizes[0], args.tasks_per_sprint, args.epics_per_sprint)
+        print(f"✅ Wrote {len(sprint_files)} sprint files with {sizes[0]} tasks to {args.generate}")
+        return 0
+
+    server = FakeJiraServer(latency=args.latency)
+    base_url = server.start()
+
+    results = []
+    try:
+        for size in sizes:
+            print(f"⏱️  Benchmarking {size} tasks...", file=sys.stderr)
+            results.append(benchmark_size(size, args, base_url, server))
+    finally:
+        server.stop()
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'config': {
+            'async_client': args.async_client,
+            'threads': args.threads,
+            'concurrency': args.concurrency,
+            'bulk': args.bulk,
+            'pipeline': args.pipeline,
+            'latency': args.latency,
+            'tasks_per_sprint': args.tasks_per_sprint,
+            'epics_per_sprint': args.epics_per_sprint,
+        },
+        'results': results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"📊 Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -9,25 +9,80 @@ Date: December 2024
 """
 
 import os
+import io
 import re
+import gzip
 import json
 import asyncio
 import base64
+import math
+import time
+import heapq
+import hashlib
+import functools
+import threading
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict
+from typing import Generator, Iterable, List, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 # Direct API imports
+import aiohttp
 import requests
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from dotenv import load_dotenv
 
+from jira_export import ImportBundleWriter, IssueIdPlan, export_records
+from jira_journal import RunJournal
+from jira_metadata import DISCOVERY_CALLS, MetadataCache, ProjectMetadata, discover_metadata
+from jira_metrics import RunMetrics, endpoint_label
+from jira_progress import RunProgress
+from jira_rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUSES
+from jira_retry import CircuitBreaker, RetryPolicy, RETRY_STATUSES
+from sprint_cache import SprintCache
+from sprint_watcher import SprintWatcher
+from task_dependencies import DependencyGraph
+from task_index import TaskIndex
+
 # Load environment variables
 load_dotenv()
 
 console = Console()
 
+# Bump when parsing changes so cached sprints are re-parsed
+PARSER_VERSION = "2"
+
+# Line patterns for the single-pass sprint parser
+SPRINT_HEADER_PATTERN = re.compile(r'# Sprint (\d+): (.+)')
+FOCUS_PATTERN = re.compile(r'\*\*Focus\*\*: (.+) with')
+DURATION_PATTERN = re.compile(r'\*\*Duration\*\*: (.+)')
+STORY_POINTS_TARGET_PATTERN = re.compile(r'\*\*Story Points Target\*\*: (\d+)')
+EPIC_HEADER_PATTERN = re.compile(r'### Epic (\d+): (.+)')
+EPIC_GOAL_PATTERN = re.compile(r'\*\*Goal\*\*: (.+)')
+TASK_BOUNDARY_PATTERN = re.compile(r'\*\*T\d+\.')
+TASK_HEADER_PATTERN = re.compile(r'\*\*T(\d+)\.(\d+)\*\* - (.+)')
+
+# Summaries of issues this script creates ("Sprint 3: Epic name", "T3.001: Task title")
+EPIC_SUMMARY_PATTERN = re.compile(r'Sprint (\d+): (.+)')
+TASK_SUMMARY_PATTERN = re.compile(r'(T\d+\.\d+): ')
+
+# Bold markdown labels ("**Assignee**:") rewritten as Jira emphasis in task descriptions
+BOLD_LABEL_PATTERN = re.compile(r'\*\*([^*]+)\*\*:')
+
+# Closing section shared by every task description
+ARCHITECTURE_REFERENCES = "\n".join([
+    "",
+    "*Architecture References:*",
+    "* EAIO 6-Layer Architecture",
+    "* Cognitive Framework Implementation",
+    "* Task Management System"
+])
+
+# First "key" of a create-issue response ({"id": "10000", "key": "SCRUM-1", "self": ...})
+ISSUE_KEY_PATTERN = re.compile(rb'"key"\s*:\s*"([^"]+)"')
+
 @dataclass
 class JiraProjectConfig:
     """Configuration for a Jira project"""
@@ -51,6 +106,7 @@ class Task:
     acceptance_criteria: List[str]
     epic: str
     sprint: str
+    source_line: Optional[int] = None  # 1-based line of the task header in its sprint file
 
 @dataclass
 class Epic:
@@ -70,6 +126,84 @@ class Sprint:
     story_points: int
     epics: List[Epic]
 
+def env_flag(name: str, default: bool = False) -> bool:
+    """Boolean setting from the environment ('true'/'false', case-insensitive)"""
+    return os.getenv(name, 'true' if default else 'false').lower() == 'true'
+
+def sprint_to_dict(sprint: Sprint) -> Dict:
+    """Serialize a sprint and its epics/tasks to plain data"""
+    return asdict(sprint)
+
+def sprint_from_dict(data: Dict) -> Sprint:
+    """Rebuild a sprint serialized with sprint_to_dict"""
+    epics = [
+        Epic(
+            name=epic['name'],
+            goal=epic['goal'],
+            tasks=[Task(**task) for task in epic['tasks']],
+            sprint=epic['sprint']
+        )
+        for epic in data['epics']
+    ]
+    return Sprint(**{**data, 'epics': epics})
+
+# Epic sections streamed by the parser: (sprint number, epic with its tasks)
+SprintSections = Generator[Tuple[Optional[int], Epic], None, Sprint]
+
+def finish_sections(sections: SprintSections) -> Sprint:
+    """Run a sprint section generator to completion and return its Sprint"""
+    while True:
+        try:
+            next(sections)
+        except StopIteration as finished:
+            return finished.value
+
+def task_content_hash(task: Task) -> str:
+    """Hash the task fields that are synced to Jira"""
+    content = json.dumps(
+        [task.title, task.description, task.story_points, task.assignee, task.acceptance_criteria],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def parse_credentials(value: str) -> List[Tuple[str, str]]:
+    """Read ``email:token`` pairs, comma- or line-separated, or from a file given as ``@path``"""
+    if value.startswith("@"):
+        with open(value[1:], 'r', encoding='utf-8') as f:
+            value = f.read()
+    credentials = []
+    for entry in re.split(r'[,\n]', value):
+        email, separator, api_token = entry.strip().partition(":")
+        if separator and email and api_token:
+            credentials.append((email, api_token))
+    return credentials
+
+def assign_epics(epics: List[Tuple[int, Epic]], shard_count: int) -> List[List[Tuple[int, Epic]]]:
+    """Split ``(sprint_number, epic)`` pairs across shards, balancing their issue counts"""
+    shards: List[List[Tuple[int, Epic]]] = [[] for _ in range(shard_count)]
+    loads = [(0, shard) for shard in range(shard_count)]
+    for sprint_number, epic in sorted(epics, key=lambda item: len(item[1].tasks), reverse=True):
+        load, shard = heapq.heappop(loads)
+        shards[shard].append((sprint_number, epic))
+        heapq.heappush(loads, (load + 1 + len(epic.tasks), shard))
+    return shards
+
+def preflight_jql(project_key: str, sprint_numbers: Optional[Iterable[int]] = None) -> str:
+    """JQL for the project's epics and tasks, narrowed to the plan's sprints when known.
+
+    Epic summaries start with "Sprint N:" and task summaries with "TN.xxx:",
+    so each sprint adds a phrase match and a prefix match on the summary.
+    """
+    jql = f'project = "{project_key}" AND '
+    numbers = sorted(set(sprint_numbers or []))
+    if numbers:
+        epics = " OR ".join(f'summary ~ "\\"Sprint {number}\\""' for number in numbers)
+        tasks = " OR ".join(f'summary ~ "T{number}*"' for number in numbers)
+        jql += f'((issuetype = Epic AND ({epics})) OR (issuetype = Task AND ({tasks})))'
+    else:
+        jql += 'issuetype in (Epic, Task)'
+    return jql + ' ORDER BY created ASC'
+
 class JiraDirectAPI:
     """Direct Jira API client with multi-project support"""
     
@@ -91,9 +225,31 @@ class JiraDirectAPI:
         )
     }
     
-    def __init__(self, base_url: str, email: str, api_token: str, project_key: str = "SCRUM"):
+    # Maximum issues Jira accepts in one bulk create request
+    BULK_CREATE_LIMIT = 50
+    
+    # Times a throttled (429/503) request is resent before giving up
+    THROTTLE_RETRIES = 5
+    
+    # Issue link type used for task dependencies
+    DEPENDENCY_LINK_TYPE = "Blocks"
+    
+    # Issues requested per page of a preflight search (Jira may return fewer)
+    PREFLIGHT_PAGE_SIZE = 1000
+    
+    # Smallest request body worth gzipping (smaller ones barely shrink)
+    GZIP_MIN_BYTES = 1024
+    
+    def __init__(self, base_url: str, email: str, api_token: str, project_key: str = "SCRUM",
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, metrics: Optional[RunMetrics] = None,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None):
         """Initialize with Jira credentials"""
         self.base_url = base_url
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.metrics = metrics or RunMetrics()
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.from_env()
+        self.compress_requests = env_flag('JIRA_GZIP_REQUESTS')
         self.email = email
         self.api_token = api_token
         self.project_key = project_key
@@ -111,6 +267,13 @@ class JiraDirectAPI:
             'Accept': 'application/json'
         }
         
+        # One keep-alive session for all synchronous requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Discovered custom fields of the current project (see load_project_metadata)
+        self.metadata: Optional[ProjectMetadata] = None
+        
         # Priority mapping
         self.priority_mapping = {
             "🔴": "High",
@@ -127,6 +290,7 @@ class JiraDirectAPI:
         if project_key in self.PROJECT_CONFIGS:
             self.project_key = project_key
             self.current_project = self.PROJECT_CONFIGS[project_key]
+            self.metadata = None
             console.print(f"🔄 Switched to project: {self.current_project.name} ({project_key})")
             return True
         else:
@@ -137,11 +301,138 @@ class JiraDirectAPI:
         """Get list of available project configurations"""
         return self.PROJECT_CONFIGS
 
+    def share_connections(self, owner: "JiraDirectAPI"):
+        """Send requests over another client's pooled connections and circuit breaker"""
+        self.session = owner.session
+        self.circuit_breaker = owner.circuit_breaker
+
+    def _encode_body(self, payload: Optional[Dict]) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+        """Serialize a compact JSON request body, gzipped when enabled and large enough.
+
+        Returns the body and the extra headers it needs.
+        """
+        if payload is None:
+            return None, None
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if self.compress_requests and len(body) >= self.GZIP_MIN_BYTES:
+            return gzip.compress(body, compresslevel=5), {'Content-Encoding': 'gzip'}
+        return body, None
+
+    def body_size(self, payload: Dict) -> int:
+        """Bytes a payload takes on the wire, encoded as _send would send it"""
+        body, _ = self._encode_body(payload)
+        return len(body)
+
+    def _compression_rejected(self, status_code: int, headers: Optional[Dict[str, str]]) -> bool:
+        """Turn gzip off if Jira refused a compressed body (415); the request is then resent plain"""
+        if status_code != 415 or not headers:
+            return False
+        if self.compress_requests:
+            self.compress_requests = False
+            console.print("⚠️ Jira does not accept gzipped request bodies, sending them uncompressed")
+        return True
+
+    def _record_outcome(self, success: bool):
+        """Feed a request outcome to the circuit breaker"""
+        if self.circuit_breaker.record(success):
+            self.metrics.increment('breaker_trips')
+            console.print(f"⛔ Jira error rate too high, pausing requests for {self.circuit_breaker.cooldown:g}s")
+
+    def _retry_delay(self, method: str, endpoint: str, attempt: int, status_code: Optional[int] = None,
+                     error: Optional[BaseException] = None) -> Optional[float]:
+        """Backoff before resending a failed request, or None if it must not be retried"""
+        if not self.retry_policy.should_retry(method, attempt, status_code, error):
+            return None
+        self.metrics.record_retry(endpoint)
+        return self.retry_policy.backoff(attempt)
+
+    def _send(self, method: str, url: str, payload: Optional[Dict] = None) -> requests.Response:
+        """Send a rate-limited request over the pooled keep-alive session.
+
+        Throttled responses are resent as paced by the rate limiter; transient
+        server and connection errors follow the retry policy.
+        """
+        endpoint = endpoint_label(method, urlsplit(url).path)
+        body, headers = self._encode_body(payload)
+        throttled = attempt = 0
+        while True:
+            self.circuit_breaker.wait()
+            self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, data=body, headers=headers,
+                                                timeout=self.retry_policy.timeout)
+            except requests.exceptions.RequestException as e:
+                self._record_outcome(False)
+                attempt += 1
+                delay = self._retry_delay(method, endpoint, attempt, error=e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            self.metrics.observe_request(endpoint, time.perf_counter() - start, response.status_code,
+                                         len(body or b''), len(response.content))
+            self.rate_limiter.update(response.status_code, response.headers)
+            self._record_outcome(response.status_code < 500)
+            
+            if self._compression_rejected(response.status_code, headers):
+                body, headers = self._encode_body(payload)
+                continue
+            if (response.status_code in THROTTLE_STATUSES and throttled < self.THROTTLE_RETRIES
+                    and self.retry_policy.resend_throttled(method, response.status_code)):
+                throttled += 1
+                self.metrics.record_retry(endpoint)
+                continue
+            if response.status_code in RETRY_STATUSES:
+                attempt += 1
+                delay = self._retry_delay(method, endpoint, attempt, status_code=response.status_code)
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
+            return response
+
+    def _get_json(self, path: str) -> Optional[Dict]:
+        """GET a JSON resource, or None if the request fails"""
+        try:
+            response = self._send('GET', f"{self.base_url}{path}")
+        except Exception as e:
+            console.print(f"❌ Request error for {path}: {str(e)}")
+            return None
+        return response.json() if response.status_code == 200 else None
+
+    def search_issues(self, jql: str, fields: List[str], page_size: int = 100) -> Optional[List[Dict]]:
+        """Return every issue matching a JQL query, or None if the search fails"""
+        url = f"{self.base_url}/rest/api/3/search/jql"
+        issues = []
+        next_page_token = None
+        while True:
+            payload = {"jql": jql, "fields": fields, "maxResults": page_size}
+            if next_page_token:
+                payload["nextPageToken"] = next_page_token
+            try:
+                response = self._send('POST', url, payload)
+            except Exception as e:
+                console.print(f"❌ Search error: {str(e)}")
+                return None
+            if response.status_code != 200:
+                console.print(f"❌ Search failed: {response.text}")
+                return None
+            
+            result = response.json()
+            issues.extend(result.get('issues', []))
+            next_page_token = result.get('nextPageToken')
+            if result.get('isLast', True) or not next_page_token:
+                return issues
+
+    def fetch_project_metadata(self) -> Optional[ProjectMetadata]:
+        """Discover the current project's issue types and custom field IDs"""
+        return discover_metadata(self._get_json, self.project_key)
+
     def test_connection(self) -> bool:
         """Test Jira connection"""
         try:
             url = f"{self.base_url}/rest/api/3/myself"
-            response = requests.get(url, headers=self.headers)
+            response = self._send('GET', url)
             if response.status_code == 200:
                 user_info = response.json()
                 console.print(f"✅ Connected as: {user_info.get('displayName', 'Unknown')}")
@@ -157,7 +448,7 @@ class JiraDirectAPI:
         """Test access to specific project"""
         try:
             url = f"{self.base_url}/rest/api/3/project/{project_key}"
-            response = requests.get(url, headers=self.headers)
+            response = self._send('GET', url)
             if response.status_code == 200:
                 project_info = response.json()
                 console.print(f"✅ Access confirmed for project: {project_info.get('name', project_key)}")
@@ -169,10 +460,8 @@ class JiraDirectAPI:
             console.print(f"❌ Project access error: {str(e)}")
             return False
 
-    def create_epic(self, epic: Epic, sprint_number: int) -> Optional[str]:
-        """Create epic in Jira"""
-        url = f"{self.base_url}/rest/api/3/issue"
-        
+    def _build_epic_payload(self, epic: Epic, sprint_number: int) -> Dict:
+        """Build the create-issue payload for an epic"""
         payload = {
             "fields": {
                 "project": {"key": self.project_key},
@@ -193,30 +482,16 @@ class JiraDirectAPI:
                     ]
                 },
                 "issuetype": {"name": "Epic"}
-                # Removed Epic Name field to avoid configuration issues
             }
         }
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 201:
-                result = response.json()
-                epic_key = result['key']
-                console.print(f"  ✅ Created Epic: {epic_key} - {epic.name}")
-                return epic_key
-            else:
-                console.print(f"  ❌ Failed to create epic: {response.text}")
-                return None
-        except Exception as e:
-            console.print(f"  ❌ Epic creation error: {str(e)}")
-            return None
+        # Epic Name only when the project's create screen has it
+        if self.metadata is not None:
+            payload["fields"].update(self.metadata.epic_fields(epic.name))
+        return payload
 
-    def create_task(self, task: Task, epic_key: str) -> Optional[str]:
-        """Create task in Jira"""
-        url = f"{self.base_url}/rest/api/3/issue"
-        
-        # Create basic task without Epic Link and Story Points (may not be configured)
+    def _build_task_payload(self, task: Task, epic_key: str) -> Dict:
+        """Build the create-issue payload for a task"""
         payload = {
             "fields": {
                 "project": {"key": self.project_key},
@@ -237,40 +512,587 @@ class JiraDirectAPI:
                     ]
                 },
                 "issuetype": {"name": "Task"}
-                # Removed custom fields to avoid configuration issues
             }
         }
         
+        # Story Points and the epic parent only when the project's create screen has them
+        if self.metadata is not None:
+            payload["fields"].update(self.metadata.task_fields(task.story_points, epic_key))
+        return payload
+
+    @staticmethod
+    def _issue_key(response) -> Optional[str]:
+        """Created issue key, read straight from the raw body without decoding the JSON"""
+        match = ISSUE_KEY_PATTERN.search(response.content)
+        return match.group(1).decode('utf-8') if match else None
+
+    def _epic_key_from_response(self, response, epic: Epic) -> Optional[str]:
+        """Read the created epic key from a create-issue response"""
+        epic_key = self._issue_key(response) if response.status_code == 201 else None
+        if epic_key:
+            console.print(f"  ✅ Created Epic: {epic_key} - {epic.name}")
+            return epic_key
+        else:
+            console.print(f"  ❌ Failed to create epic: {response.text}")
+            return None
+
+    def _task_key_from_response(self, response, task: Task) -> Optional[str]:
+        """Read the created task key from a create-issue response"""
+        task_key = self._issue_key(response) if response.status_code == 201 else None
+        if task_key:
+            return task_key
+        console.print(f"    ❌ Failed to create task {task.id}: {response.text}")
+        return None
+
+    def _task_keys_from_bulk_response(self, response, tasks: List[Task]) -> Dict[str, Optional[str]]:
+        """Map a bulk create response back to task IDs.
+
+        Jira returns created issues in request order, skipping failed
+        elements, which are reported by index in ``errors``.
+        """
+        if response.status_code not in (201, 400):
+            console.print(f"    ❌ Bulk task creation failed: {response.text}")
+            return {task.id: None for task in tasks}
+        
+        # A fully successful batch lists one key per task, in request order
+        if response.status_code == 201:
+            keys = ISSUE_KEY_PATTERN.findall(response.content)
+            if len(keys) == len(tasks):
+                return {task.id: key.decode('utf-8') for task, key in zip(tasks, keys)}
+        
+        result = response.json()
+        element_errors = {
+            error.get('failedElementNumber'): error.get('elementErrors', {})
+            for error in result.get('errors', [])
+        }
+        created_issues = iter(result.get('issues', []))
+        
+        task_keys = {}
+        for index, task in enumerate(tasks):
+            if index in element_errors:
+                console.print(f"    ❌ Failed to create task {task.id}: {json.dumps(element_errors[index])}")
+                task_keys[task.id] = None
+            else:
+                issue = next(created_issues, None)
+                task_keys[task.id] = issue['key'] if issue else None
+        return task_keys
+
+    def create_epic(self, epic: Epic, sprint_number: int) -> Optional[str]:
+        """Create epic in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue"
+        payload = self._build_epic_payload(epic, sprint_number)
+        
+        try:
+            response = self._send('POST', url, payload)
+            return self._epic_key_from_response(response, epic)
+        except Exception as e:
+            console.print(f"  ❌ Epic creation error: {str(e)}")
+            return None
+
+    def create_task(self, task: Task, epic_key: str) -> Optional[str]:
+        """Create task in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue"
+        payload = self._build_task_payload(task, epic_key)
+        
+        try:
+            response = self._send('POST', url, payload)
+            return self._task_key_from_response(response, task)
+        except Exception as e:
+            console.print(f"    ❌ Task creation error: {str(e)}")
+            return None
+
+    def create_tasks_bulk(self, tasks: List[Task], epic_key: str) -> Dict[str, Optional[str]]:
+        """Create tasks in Jira with bulk requests, returning keys by task ID"""
+        url = f"{self.base_url}/rest/api/3/issue/bulk"
+        task_keys = {}
+        
+        for start in range(0, len(tasks), self.BULK_CREATE_LIMIT):
+            batch = tasks[start:start + self.BULK_CREATE_LIMIT]
+            payload = {"issueUpdates": [self._build_task_payload(task, epic_key) for task in batch]}
+            try:
+                response = self._send('POST', url, payload)
+                task_keys.update(self._task_keys_from_bulk_response(response, batch))
+            except Exception as e:
+                console.print(f"    ❌ Bulk task creation error: {str(e)}")
+                task_keys.update({task.id: None for task in batch})
+        
+        return task_keys
+
+    def _build_task_update_payload(self, task: Task, epic_key: str) -> Dict:
+        """Build the edit-issue payload for a task (fields that may change)"""
+        fields = self._build_task_payload(task, epic_key)["fields"]
+        update = {"summary": fields["summary"], "description": fields["description"]}
+        story_points_field = self.metadata.story_points_field if self.metadata is not None else None
+        if story_points_field in fields:
+            update[story_points_field] = fields[story_points_field]
+        return {"fields": update}
+
+    def _task_update_from_response(self, response, task: Task) -> bool:
+        """Check an edit-issue response"""
+        if response.status_code == 204:
+            return True
+        console.print(f"    ❌ Failed to update task {task.id}: {response.text}")
+        return False
+
+    def update_task(self, task: Task, task_key: str, epic_key: str) -> bool:
+        """Update an existing task in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue/{task_key}"
+        payload = self._build_task_update_payload(task, epic_key)
+        
+        try:
+            response = self._send('PUT', url, payload)
+            return self._task_update_from_response(response, task)
+        except Exception as e:
+            console.print(f"    ❌ Task update error: {str(e)}")
+            return False
+
+    def _build_issue_link_payload(self, blocker_key: str, blocked_key: str) -> Dict:
+        """Build the issue-link payload for a dependency"""
+        # Jira reads the link from inwardIssue to outwardIssue with the
+        # type's outward description ("blocks"), so the blocker is inward
+        return {
+            "type": {"name": self.DEPENDENCY_LINK_TYPE},
+            "inwardIssue": {"key": blocker_key},
+            "outwardIssue": {"key": blocked_key}
+        }
+
+    def _issue_link_from_response(self, response, blocker_key: str, blocked_key: str) -> bool:
+        """Check an issue-link response"""
+        if response.status_code == 201:
+            return True
+        console.print(f"    ❌ Failed to link {blocker_key} → {blocked_key}: {response.text}")
+        return False
+
+    def create_issue_link(self, blocker_key: str, blocked_key: str) -> bool:
+        """Link two issues so that blocker_key blocks blocked_key"""
+        url = f"{self.base_url}/rest/api/3/issueLink"
+        payload = self._build_issue_link_payload(blocker_key, blocked_key)
+        
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._send('POST', url, payload)
+            return self._issue_link_from_response(response, blocker_key, blocked_key)
+        except Exception as e:
+            console.print(f"    ❌ Issue link error: {str(e)}")
+            return False
+
+@dataclass
+class JiraResponse:
+    """Buffered HTTP response with the requests.Response attributes the clients read"""
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str]
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+class AsyncJiraAPI(JiraDirectAPI):
+    """Async Jira API client with one pooled keep-alive connector.
+
+    Issue creation runs on a shared aiohttp session and at most
+    ``max_concurrency`` requests are in flight at once. Connection and
+    project checks stay on the inherited synchronous session.
+    """
+    
+    def __init__(self, base_url: str, email: str, api_token: str, project_key: str = "SCRUM",
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, max_concurrency: int = 8,
+                 metrics: Optional[RunMetrics] = None, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        """Initialize with Jira credentials and the in-flight request limit"""
+        super().__init__(base_url, email, api_token, project_key, rate_limiter, metrics,
+                         retry_policy, circuit_breaker)
+        self.max_concurrency = max_concurrency
+        self.pool_size = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pool_owner: Optional["AsyncJiraAPI"] = None
+
+    def share_connections(self, owner: "JiraDirectAPI"):
+        """Send requests over another client's pooled connections, keeping this client's in-flight limit"""
+        super().share_connections(owner)
+        if isinstance(owner, AsyncJiraAPI):
+            self._pool_owner = owner
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on the running event loop"""
+        if self._pool_owner is not None:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            return self._pool_owner._get_session()
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            timeout = aiohttp.ClientTimeout(total=self.retry_policy.timeout)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """Close the pooled session (a shared pool is closed by its owner)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _send_async(self, method: str, url: str, payload: Optional[Dict] = None) -> JiraResponse:
+        """Send a rate-limited request over the pooled session, bounded by the in-flight limit"""
+        session = self._get_session()
+        endpoint = endpoint_label(method, urlsplit(url).path)
+        body, headers = self._encode_body(payload)
+        throttled = attempt = 0
+        while True:
+            await self.circuit_breaker.wait_async()
+            await self.rate_limiter.acquire_async()
+            try:
+                async with self._semaphore:
+                    start = time.perf_counter()
+                    async with session.request(method, url, data=body, headers=headers) as response:
+                        result = JiraResponse(response.status, await response.read(), response.headers)
+                    self.metrics.observe_request(endpoint, time.perf_counter() - start, result.status_code,
+                                                 len(body or b''), len(result.content))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._record_outcome(False)
+                attempt += 1
+                delay = self._retry_delay(method, endpoint, attempt, error=e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.rate_limiter.update(result.status_code, result.headers)
+            self._record_outcome(result.status_code < 500)
             
-            if response.status_code == 201:
-                result = response.json()
-                task_key = result['key']
-                return task_key
-            else:
-                console.print(f"    ❌ Failed to create task {task.id}: {response.text}")
-                return None
+            if self._compression_rejected(result.status_code, headers):
+                body, headers = self._encode_body(payload)
+                continue
+            if (result.status_code in THROTTLE_STATUSES and throttled < self.THROTTLE_RETRIES
+                    and self.retry_policy.resend_throttled(method, result.status_code)):
+                throttled += 1
+                self.metrics.record_retry(endpoint)
+                continue
+            if result.status_code in RETRY_STATUSES:
+                attempt += 1
+                delay = self._retry_delay(method, endpoint, attempt, status_code=result.status_code)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    continue
+            return result
+
+    async def create_epic(self, epic: Epic, sprint_number: int) -> Optional[str]:
+        """Create epic in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue"
+        payload = self._build_epic_payload(epic, sprint_number)
+        
+        try:
+            response = await self._send_async('POST', url, payload)
+            return self._epic_key_from_response(response, epic)
+        except Exception as e:
+            console.print(f"  ❌ Epic creation error: {str(e)}")
+            return None
+
+    async def create_task(self, task: Task, epic_key: str) -> Optional[str]:
+        """Create task in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue"
+        payload = self._build_task_payload(task, epic_key)
+        
+        try:
+            response = await self._send_async('POST', url, payload)
+            return self._task_key_from_response(response, task)
         except Exception as e:
             console.print(f"    ❌ Task creation error: {str(e)}")
             return None
 
+    async def create_tasks_bulk(self, tasks: List[Task], epic_key: str) -> Dict[str, Optional[str]]:
+        """Create tasks in Jira with bulk requests, returning keys by task ID"""
+        url = f"{self.base_url}/rest/api/3/issue/bulk"
+        task_keys = {}
+        
+        for start in range(0, len(tasks), self.BULK_CREATE_LIMIT):
+            batch = tasks[start:start + self.BULK_CREATE_LIMIT]
+            payload = {"issueUpdates": [self._build_task_payload(task, epic_key) for task in batch]}
+            try:
+                response = await self._send_async('POST', url, payload)
+                task_keys.update(self._task_keys_from_bulk_response(response, batch))
+            except Exception as e:
+                console.print(f"    ❌ Bulk task creation error: {str(e)}")
+                task_keys.update({task.id: None for task in batch})
+        
+        return task_keys
+
+    async def update_task(self, task: Task, task_key: str, epic_key: str) -> bool:
+        """Update an existing task in Jira"""
+        url = f"{self.base_url}/rest/api/3/issue/{task_key}"
+        payload = self._build_task_update_payload(task, epic_key)
+        
+        try:
+            response = await self._send_async('PUT', url, payload)
+            return self._task_update_from_response(response, task)
+        except Exception as e:
+            console.print(f"    ❌ Task update error: {str(e)}")
+            return False
+
+    async def create_issue_link(self, blocker_key: str, blocked_key: str) -> bool:
+        """Link two issues so that blocker_key blocks blocked_key"""
+        url = f"{self.base_url}/rest/api/3/issueLink"
+        payload = self._build_issue_link_payload(blocker_key, blocked_key)
+        
+        try:
+            response = await self._send_async('POST', url, payload)
+            return self._issue_link_from_response(response, blocker_key, blocked_key)
+        except Exception as e:
+            console.print(f"    ❌ Issue link error: {str(e)}")
+            return False
+
+class ThreadedJiraAPI(JiraDirectAPI):
+    """Blocking Jira API client run on a bounded thread pool.
+
+    Each worker thread keeps its own keep-alive ``requests.Session``, so the
+    unchanged synchronous client code runs ``max_concurrency`` requests in
+    parallel when its calls are offloaded with ``run_in_pool``.
+    """
+    
+    def __init__(self, base_url: str, email: str, api_token: str, project_key: str = "SCRUM",
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, max_concurrency: int = 8,
+                 metrics: Optional[RunMetrics] = None, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        """Initialize with Jira credentials and the number of worker threads"""
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pool_owner: Optional["ThreadedJiraAPI"] = None
+        super().__init__(base_url, email, api_token, project_key, rate_limiter, metrics,
+                         retry_policy, circuit_breaker)
+        self.max_concurrency = max_concurrency
+        self.pool_size = max_concurrency
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's keep-alive session"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self.session = session
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session):
+        self._local.session = session
+        owner = self._pool_owner or self
+        with owner._sessions_lock:
+            owner._sessions.append(session)
+
+    def share_connections(self, owner: "JiraDirectAPI"):
+        """Run requests on another client's worker threads and sessions"""
+        self.circuit_breaker = owner.circuit_breaker
+        if isinstance(owner, ThreadedJiraAPI):
+            self._local = owner._local
+            self._pool_owner = owner
+        else:
+            self.session = owner.session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use"""
+        if self._pool_owner is not None:
+            return self._pool_owner._get_executor()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="jira")
+        return self._executor
+
+    async def run_in_pool(self, method, *args):
+        """Run a blocking client call on a worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(method, *args))
+
+    def close(self):
+        """Stop the worker threads and close their sessions (a shared pool is closed by its owner)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._pool_owner is None:
+            with self._sessions_lock:
+                sessions, self._sessions = self._sessions, []
+            for session in sessions:
+                session.close()
+
 class EAIOJiraAutomation:
     """Main automation class for creating EAIO tasks in Jira with multi-project support"""
     
-    def __init__(self, jira_url: str, email: str, api_token: str, project_key: str = "SCRUM"):
+    def __init__(self, jira_url: str, email: str, api_token: str, project_key: str = "SCRUM",
+                 async_client: Optional[bool] = None, max_concurrency: Optional[int] = None,
+                 bulk_create: Optional[bool] = None, sync_mode: Optional[bool] = None,
+                 link_dependencies: Optional[bool] = None, pipeline: Optional[bool] = None,
+                 thread_pool: Optional[bool] = None):
         """Initialize automation with Jira credentials"""
-        self.jira_client = JiraDirectAPI(jira_url, email, api_token, project_key)
-        self.stats = {
-            'sprints_processed': 0,
-            'epics_created': 0,
-            'epics_failed': 0,
-            'tasks_created': 0,
-            'tasks_failed': 0
-        }
+        if async_client is None:
+            async_client = env_flag('JIRA_ASYNC_CLIENT')
+        if thread_pool is None:
+            thread_pool = env_flag('JIRA_THREAD_POOL')
+        if bulk_create is None:
+            bulk_create = env_flag('JIRA_BULK_CREATE')
+        self.bulk_create = bulk_create
+        
+        # Sync mode updates journaled tasks whose content changed
+        if sync_mode is None:
+            sync_mode = env_flag('JIRA_SYNC_MODE')
+        self.sync_mode = sync_mode
+        
+        # Resolve custom fields (Story Points, epic parent) from cached project metadata
+        self.field_discovery = env_flag('JIRA_FIELD_DISCOVERY', default=True)
+        
+        # Look up existing epics/tasks with JQL before creating anything
+        self.preflight = env_flag('JIRA_PREFLIGHT', default=True)
+        
+        # Link tasks to the tasks they depend on ("blocks" links) after creation
+        if link_dependencies is None:
+            link_dependencies = env_flag('JIRA_LINK_DEPENDENCIES')
+        self.link_dependencies = link_dependencies
+        
+        # Stream epics/tasks from the parser to creation workers as they are parsed
+        if pipeline is None:
+            pipeline = env_flag('JIRA_PIPELINE')
+        self.pipeline = pipeline
+        
+        # Live progress view (rate, ETA) instead of one line per created issue
+        self.show_progress = env_flag('JIRA_PROGRESS')
+        self.progress: Optional[RunProgress] = None
         
-        # Rate limiting
+        # Cache parsed sprint files on disk, keyed by path/mtime/content hash
+        self.use_sprint_cache = env_flag('SPRINT_CACHE', default=True)
+        
+        # Worker processes for parsing sprint files (0 or 1 = sequential)
+        self.parse_workers = int(os.getenv('PARSE_WORKERS', '0'))
+        
+        # Rate limiting: RATE_LIMIT_DELAY sets the starting request spacing,
+        # the shared limiter then adapts to Jira's responses
         self.rate_limit_delay = float(os.getenv('RATE_LIMIT_DELAY', '0.5'))
+        self.rate_limiter = AdaptiveRateLimiter.from_delay(
+            self.rate_limit_delay, max_rate=float(os.getenv('RATE_LIMIT_MAX_RPS', '20'))
+        )
+        
+        # Run counters, request latencies and phase timings
+        self.metrics = RunMetrics()
+        
+        # Blocking clients can only create one issue at a time
+        if async_client:
+            self.max_concurrency = max_concurrency or int(os.getenv('MAX_CONCURRENCY', '8'))
+            self.jira_client = AsyncJiraAPI(jira_url, email, api_token, project_key,
+                                            rate_limiter=self.rate_limiter,
+                                            max_concurrency=self.max_concurrency,
+                                            metrics=self.metrics)
+        elif thread_pool:
+            self.max_concurrency = max_concurrency or int(os.getenv('MAX_CONCURRENCY', '8'))
+            self.jira_client = ThreadedJiraAPI(jira_url, email, api_token, project_key,
+                                               rate_limiter=self.rate_limiter,
+                                               max_concurrency=self.max_concurrency,
+                                               metrics=self.metrics)
+        else:
+            self.max_concurrency = 1
+            self.jira_client = JiraDirectAPI(jira_url, email, api_token, project_key,
+                                             rate_limiter=self.rate_limiter, metrics=self.metrics)
+        self.task_semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Run journal of created issues, opened per sprints directory
+        self.journal: Optional[RunJournal] = None
+        
+        # Extra service accounts; epics are split across them, each with its own session and limiter
+        self.shard_credentials = parse_credentials(os.getenv('JIRA_SHARD_CREDENTIALS', ''))
+        self._shards: List["EAIOJiraAutomation"] = []
+        
+        # Jira keys of the tasks created or found during this run
+        self.task_keys: Dict[str, str] = {}
+        
+        # Parsed tasks by ID, assignee and priority (see build_task_index)
+        self.task_index: Optional[TaskIndex] = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the run counters (epics/tasks created, failed, skipped...)"""
+        return self.metrics.counters()
+
+    def write_metrics(self, sprints_directory: str, label: Optional[str] = None) -> Path:
+        """Write the metrics snapshots next to the sprints directory, or to METRICS_DIR"""
+        metrics_dir = Path(os.getenv('METRICS_DIR') or Path(sprints_directory).parent)
+        metrics_path = self.metrics.write(metrics_dir, label)
+        print(f"📈 Run metrics: {metrics_path}")
+        return metrics_path
+
+    def open_journal(self, sprints_directory: str, create: bool = True) -> Optional[RunJournal]:
+        """Open the run journal next to the sprints directory"""
+        if self.journal is None:
+            if not create and not RunJournal.path_for_sprints_directory(sprints_directory).exists():
+                return None
+            self.journal = RunJournal.for_sprints_directory(sprints_directory)
+            print(f"📒 Run journal: {self.journal.path}")
+        return self.journal
+
+    def load_project_metadata(self, sprints_directory: str, fetch: bool = True) -> Optional[ProjectMetadata]:
+        """Give the Jira client the project's custom field IDs, from the cache or from Jira"""
+        if not self.field_discovery:
+            return None
+        client = self.jira_client
+        cache = MetadataCache.for_sprints_directory(sprints_directory)
+        metadata = cache.load(client.base_url, client.project_key)
+        if metadata is None and fetch:
+            with self.metrics.phase('preflight'):
+                metadata = client.fetch_project_metadata()
+            if metadata is not None:
+                cache.store(client.base_url, metadata)
+        
+        client.metadata = metadata
+        if metadata is not None:
+            print(f"🧩 {client.project_key} fields: story points {metadata.story_points_field or 'n/a'}, "
+                  f"epic parent {metadata.epic_parent_field() or 'n/a'}, epic name {metadata.epic_name_field or 'n/a'}")
+        elif fetch:
+            print(f"⚠️  Could not read {client.project_key} metadata; creating issues without custom fields")
+        return metadata
+
+    def preflight_existing_issues(self, sprint_numbers: Optional[Iterable[int]] = None) -> Optional[Dict[str, int]]:
+        """Record epics and tasks that already exist in the project in the run journal.
+
+        One paged JQL search lists the project's epics and tasks (only those
+        of ``sprint_numbers`` when given); those whose summary matches an
+        epic or task of the plan format and are missing from the journal are
+        recorded, so they are skipped (or updated in sync mode) instead of
+        being created again.
+        """
+        if not self.preflight or self.journal is None:
+            return None
+        
+        client = self.jira_client
+        project_key = client.project_key
+        jql = preflight_jql(project_key, sprint_numbers)
+        with self.metrics.phase('preflight'):
+            issues = client.search_issues(jql, ["summary", "issuetype", "parent"], page_size=client.PREFLIGHT_PAGE_SIZE)
+        if issues is None:
+            print(f"⚠️  Could not search {project_key} for existing issues; relying on the run journal")
+            return None
+        
+        found = {'issues': len(issues), 'epics': 0, 'tasks': 0}
+        for issue in issues:
+            fields = issue.get('fields', {})
+            summary = fields.get('summary') or ""
+            issue_type = (fields.get('issuetype') or {}).get('name')
+            
+            epic_match = EPIC_SUMMARY_PATTERN.fullmatch(summary)
+            task_match = TASK_SUMMARY_PATTERN.match(summary)
+            if issue_type == "Epic" and epic_match:
+                sprint_number, epic_name = int(epic_match.group(1)), epic_match.group(2)
+                if not self.journal.get_epic_key(project_key, sprint_number, epic_name):
+                    self.journal.record_epic(project_key, sprint_number, epic_name, issue['key'])
+                    found['epics'] += 1
+            elif issue_type == "Task" and task_match:
+                task_id = task_match.group(1)
+                if not self.journal.get_task_key(project_key, task_id):
+                    epic_key = (fields.get('parent') or {}).get('key', "")
+                    self.journal.record_task(project_key, task_id, epic_key, issue['key'])
+                    found['tasks'] += 1
+        
+        print(f"🔎 Preflight: {found['issues']} epics/tasks in {project_key}, "
+              f"{found['epics']} epics and {found['tasks']} tasks added to the journal")
+        return found
 
     def switch_project(self, project_key: str) -> bool:
         """Switch to different Jira project"""
@@ -284,222 +1106,443 @@ class EAIOJiraAutomation:
         """Test access to specific project"""
         return self.jira_client.test_project_access(project_key)
 
-    def parse_sprint_file(self, file_path: Path) -> Sprint:
-        """Parse a sprint markdown file and extract tasks"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    async def close(self):
+        """Release the Jira clients' pooled connections and the run journal"""
+        for automation in self._shards + [self]:
+            if isinstance(automation.jira_client, AsyncJiraAPI):
+                await automation.jira_client.close()
+            elif isinstance(automation.jira_client, ThreadedJiraAPI):
+                automation.jira_client.close()
+        self._shards = []
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def shards(self) -> List["EAIOJiraAutomation"]:
+        """One automation per shard credential, created on first use.
+
+        Each shard has its own session, in-flight limit and adaptive rate
+        limiter, so per-user rate limits apply per shard. Shards write to
+        this automation's metrics, journal, task keys and field metadata, so
+        the run reports and resumes as one. Blocking calls would run the
+        shards one after another on the event loop, so shards of a plain
+        blocking client run on the thread pool instead.
+        """
+        if self._shards or not self.shard_credentials:
+            return self._shards
         
-        # Extract sprint metadata
-        sprint_match = re.search(r'# Sprint (\d+): (.+)', content)
-        if not sprint_match:
-            raise ValueError(f"Could not parse sprint number from {file_path}")
+        client = self.jira_client
+        if type(client) is JiraDirectAPI:
+            print("🧵 Sharded requests run on the thread pool (the blocking client would serialize them)")
+        for email, api_token in self.shard_credentials:
+            shard = EAIOJiraAutomation(
+                client.base_url, email, api_token, client.project_key,
+                async_client=isinstance(client, AsyncJiraAPI), max_concurrency=self.max_concurrency,
+                bulk_create=self.bulk_create, sync_mode=self.sync_mode,
+                link_dependencies=False, pipeline=False,
+                thread_pool=not isinstance(client, AsyncJiraAPI)
+            )
+            shard.shard_credentials = []
+            shard.metrics = shard.jira_client.metrics = self.metrics
+            shard.jira_client.circuit_breaker = client.circuit_breaker
+            shard.jira_client.metadata = client.metadata
+            shard.journal = self.journal
+            shard.task_keys = self.task_keys
+            shard.task_index = self.task_index
+            self._shards.append(shard)
+        return self._shards
+
+    def _warn_unsharded(self, mode: str):
+        """Say that shard credentials are ignored by a mode that does not shard"""
+        if self.shard_credentials:
+            print(f"⚠️  Sharding is not supported with {mode}: {len(self.shard_credentials)} shard credentials "
+                  f"ignored, all requests use {self.jira_client.email}")
+
+    def _shard_epics(self, sprints: List[Sprint], shards: List["EAIOJiraAutomation"]) -> List[Tuple["EAIOJiraAutomation", int, Epic]]:
+        """Split the sprints' epics across shards as ``(shard, sprint_number, epic)``"""
+        assignments = assign_epics([(sprint.number, epic) for sprint in sprints for epic in sprint.epics], len(shards))
+        print(f"🔀 Sharding {sum(len(epics) for epics in assignments)} epics across {len(shards)} credentials")
+        for shard, epics in zip(shards, assignments):
+            print(f"   {shard.jira_client.email}: {len(epics)} epics, {sum(len(epic.tasks) for _, epic in epics)} tasks")
+            shard.task_index = self.task_index
+            shard.progress = self.progress
+        return [(shard, sprint_number, epic) for shard, epics in zip(shards, assignments) for sprint_number, epic in epics]
+
+    def fan_out(self, project_keys: List[str]) -> Dict[str, "EAIOJiraAutomation"]:
+        """One automation per project, sharing this automation's connection pool and journal.
+
+        Each project keeps its own stats, in-flight limit and adaptive rate
+        limiter, whose ceiling is an equal share of RATE_LIMIT_MAX_RPS.
+        Journal entries are already namespaced by project key.
+        """
+        client = self.jira_client
+        max_rate = self.rate_limiter.max_rate / len(project_keys)
+        if isinstance(client, (AsyncJiraAPI, ThreadedJiraAPI)):
+            client.pool_size = self.max_concurrency * len(project_keys)
         
-        sprint_number = int(sprint_match.group(1))
-        sprint_name = sprint_match.group(2)
+        automations = {}
+        for project_key in project_keys:
+            automation = EAIOJiraAutomation(
+                client.base_url, client.email, client.api_token, project_key,
+                async_client=isinstance(client, AsyncJiraAPI), max_concurrency=self.max_concurrency,
+                thread_pool=isinstance(client, ThreadedJiraAPI),
+                bulk_create=self.bulk_create, sync_mode=self.sync_mode,
+                link_dependencies=self.link_dependencies, pipeline=False
+            )
+            automation.rate_limiter = AdaptiveRateLimiter.from_delay(self.rate_limit_delay, max_rate=max_rate)
+            automation.jira_client.rate_limiter = automation.rate_limiter
+            automation.jira_client.share_connections(client)
+            automation.journal = self.journal
+            automation.shard_credentials = []
+            automations[project_key] = automation
+        return automations
+
+    async def process_projects(self, project_keys: List[str],
+                               sprints_directory: str = ".cursor/tasks/sprints") -> Dict[str, "EAIOJiraAutomation"]:
+        """Parse the sprints once and create them in several projects concurrently"""
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
+            return {}
         
-        # Extract layer focus
-        layer_focus_match = re.search(r'\*\*Focus\*\*: (.+) with', content)
-        layer_focus = layer_focus_match.group(1) if layer_focus_match else "Unknown"
+        self._warn_unsharded("--projects")
+        self.open_journal(sprints_directory)
+        print(f"🎯 Found {len(sprint_files)} sprint files for projects: {', '.join(project_keys)}")
+        print("=" * 60)
         
-        # Extract duration
-        duration_match = re.search(r'\*\*Duration\*\*: (.+)', content)
-        duration = duration_match.group(1) if duration_match else "14 days"
+        sprints = [sprint for _, sprint in self._load_sprints(sprint_files)]
         
-        # Extract total story points
-        story_points_match = re.search(r'\*\*Story Points Target\*\*: (\d+)', content)
-        story_points = int(story_points_match.group(1)) if story_points_match else 0
+        automations = self.fan_out(project_keys)
+        for automation in automations.values():
+            automation.load_project_metadata(sprints_directory)
+            automation.preflight_existing_issues(sprint.number for sprint in sprints)
         
-        # Parse epics and tasks
-        epics = self._parse_epics(content, sprint_number, sprint_name)
+        async def run(automation: "EAIOJiraAutomation"):
+            with automation.metrics.phase('project'):
+                for sprint in await automation.process_sprints(sprints):
+                    automation.metrics.increment('sprints_processed')
+                if automation.link_dependencies:
+                    await automation.create_dependency_links(sprints)
         
-        return Sprint(
-            number=sprint_number,
-            name=sprint_name,
-            layer_focus=layer_focus,
-            duration=duration,
-            story_points=story_points,
-            epics=epics
-        )
+        with self.live_progress(sprints, list(automations.values())):
+            await asyncio.gather(*(run(automation) for automation in automations.values()))
+        
+        print("\n" + "=" * 60)
+        print("🎉 EAIO Jira automation completed!")
+        for project_key, automation in automations.items():
+            print(f"📈 {project_key}: {automation.stats}")
+            automation.write_metrics(sprints_directory, label=project_key)
+        return automations
 
-    def _parse_epics(self, content: str, sprint_number: int, sprint_name: str) -> List[Epic]:
-        """Parse epics from sprint content"""
-        epics = []
-        
-        # First, parse all tasks in the sprint
-        all_tasks = self._parse_all_tasks(content, sprint_number, sprint_name)
-        print(f"  📋 Found {len(all_tasks)} total tasks in sprint")
-        
-        # Find epic sections with their positions
-        epic_pattern = r'### Epic (\d+): (.+?)\n\*\*Goal\*\*: (.+?)(?=\n\n|\n### Epic|\Z)'
-        epic_matches = list(re.finditer(epic_pattern, content, re.DOTALL))
-        
-        epic_count = 0
-        for i, epic_match in enumerate(epic_matches):
-            epic_count += 1
-            epic_number = epic_match.group(1)
-            epic_name = epic_match.group(2)
-            epic_goal = epic_match.group(3)
-            epic_start_pos = epic_match.start()
-            
-            # Find the next epic position or end of content
-            if i + 1 < len(epic_matches):
-                epic_end_pos = epic_matches[i + 1].start()
+    async def _call_client(self, method, *args):
+        """Call a Jira client method: on a worker thread for the threaded client, awaited for the async client"""
+        if self.progress is not None:
+            self.progress.in_flight += 1
+        try:
+            if isinstance(self.jira_client, ThreadedJiraAPI):
+                return await self.jira_client.run_in_pool(method, *args)
+            result = method(*args)
+            if asyncio.iscoroutine(result):
+                return await result
+            return result
+        finally:
+            if self.progress is not None:
+                self.progress.in_flight -= 1
+
+    @contextlib.contextmanager
+    def live_progress(self, sprints: List[Sprint], automations: Optional[List["EAIOJiraAutomation"]] = None):
+        """Show the live progress view while the sprints' issues are created.
+
+        With ``automations`` (one per project) the view covers all of them.
+        Does nothing when JIRA_PROGRESS is off or a view is already live.
+        """
+        if not self.show_progress or self.progress is not None:
+            yield
+            return
+        automations = automations or [self]
+        progress = RunProgress([automation.metrics for automation in automations], console=console)
+        progress.add(len(automations) * sum(1 + len(epic.tasks) for sprint in sprints for epic in sprint.epics))
+        for automation in automations:
+            automation.progress = progress
+        try:
+            with progress:
+                yield
+        finally:
+            for automation in automations:
+                automation.progress = None
+
+    def _log(self, message: str):
+        """Print a per-issue line, unless the live progress view replaces them"""
+        if self.progress is None:
+            print(message)
+
+    def parse_sprint_file(self, file_path: Path) -> Sprint:
+        """Parse a sprint markdown file and extract tasks"""
+        return finish_sections(self.iter_sprint_file(file_path))
+
+    def iter_sprint_file(self, file_path: Path) -> SprintSections:
+        """Stream a sprint file's epics (with their tasks) as they are parsed.
+
+        Yields ``(sprint_number, epic)`` once each epic section is complete
+        and returns the whole Sprint. Cached sprints are replayed epic by epic.
+        """
+        if not self.use_sprint_cache:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            return (yield from self._iter_sprint_sections(content, file_path))
+        
+        # Unchanged files load from the parse cache without being read
+        cache = SprintCache.for_sprint_file(file_path, PARSER_VERSION)
+        cached = cache.load_unchanged(file_path)
+        if cached is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            cached = cache.load_matching(file_path, content)
+        
+        if cached is not None:
+            sprint = sprint_from_dict(cached)
+            for epic in sprint.epics:
+                yield sprint.number, epic
+            return sprint
+        
+        sprint = yield from self._iter_sprint_sections(content, file_path)
+        cache.store(file_path, content, sprint_to_dict(sprint))
+        return sprint
+
+    def _sprint_files(self, sprints_directory: str) -> Optional[List[Path]]:
+        """Sorted sprint files of a directory, or None (reported) if the directory is missing"""
+        sprints_path = Path(sprints_directory)
+        if not sprints_path.exists():
+            print(f"❌ Sprints directory not found: {sprints_directory}")
+            return None
+        return sorted(sprints_path.glob("sprint_*.md"))
+
+    def _load_sprints(self, sprint_files: List[Path], workers: Optional[int] = None) -> List[Tuple[Path, Sprint]]:
+        """Parse sprint files as part of the parse phase, reporting the ones that fail.
+
+        Returns ``(sprint_file, sprint)`` for the files that parsed, in order.
+        """
+        loaded = []
+        with self.metrics.phase('parse'):
+            parsed_sprints = self.parse_sprint_files(sprint_files, workers)
+        for sprint_file, sprint in parsed_sprints:
+            if isinstance(sprint, Exception):
+                print(f"❌ Error processing {sprint_file.name}: {str(sprint)}")
             else:
-                epic_end_pos = len(content)
-            
-            # Get tasks that belong to this epic
-            epic_tasks = [task for task in all_tasks 
-                         if self._task_belongs_to_epic(content, task, epic_start_pos, epic_end_pos)]
+                loaded.append((sprint_file, sprint))
+        return loaded
+
+    def parse_sprint_files(self, sprint_files: List[Path],
+                           workers: Optional[int] = None) -> List[Tuple[Path, Union[Sprint, Exception]]]:
+        """Parse sprint files, in parallel processes when workers > 1.
+
+        Results keep the order of ``sprint_files``; a file that fails to
+        parse is paired with its exception instead of a Sprint.
+        """
+        workers = self.parse_workers if workers is None else workers
+        if workers <= 1 or len(sprint_files) <= 1:
+            results = []
+            for sprint_file in sprint_files:
+                try:
+                    results.append((sprint_file, self.parse_sprint_file(sprint_file)))
+                except Exception as e:
+                    results.append((sprint_file, e))
+            return results
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_parse_sprint_file_worker, str(sprint_file)) for sprint_file in sprint_files]
+            results = []
+            for sprint_file, future in zip(sprint_files, futures):
+                try:
+                    results.append((sprint_file, sprint_from_dict(future.result())))
+                except Exception as e:
+                    results.append((sprint_file, e))
+            return results
+
+    def _iter_sprint_sections(self, content: str, file_path: Path) -> SprintSections:
+        """Parse sprint content in a single line-oriented pass.
+
+        Sprint metadata, epic headers and task blocks are recognized as the
+        lines are read, and each task is assigned to the epic section it
+        appears in, so the content is never rescanned per epic or per task.
+        Each epic is yielded as soon as its section ends.
+        """
+        sprint_match = None
+        layer_focus = None
+        duration = None
+        story_points = None
+        
+        epics: List[Epic] = []
+        current_epic: Optional[Epic] = None
+        pending_epic_name: Optional[str] = None
+        goal_lines: Optional[List[str]] = None
+        task_header = None
+        task_line = None
+        task_lines: List[str] = []
+        task_count = 0
+        
+        def close_task(trim_newline: bool = False):
+            """Build the open task block and attach it to the current epic"""
+            nonlocal task_header, task_count
+            if task_header is None:
+                return
             
-            # Update epic name for tasks
-            for task in epic_tasks:
-                task.epic = epic_name
+            task_content = "".join(task_lines)
+            if trim_newline and task_content.endswith("\n"):
+                task_content = task_content[:-1]
             
-            print(f"    📝 Found Epic {epic_count}: {epic_name}")
-            print(f"    📋 Assigned {len(epic_tasks)} tasks to epic: {epic_name}")
+            sprint_name = sprint_match.group(2) if sprint_match else ""
+            task = self._build_task(*task_header, task_content, sprint_name)
+            task.source_line = task_line
+            task_count += 1
+            if current_epic is not None:
+                task.epic = current_epic.name
+                current_epic.tasks.append(task)
             
-            epics.append(Epic(
-                name=epic_name,
-                goal=epic_goal,
-                tasks=epic_tasks,
-                sprint=sprint_name
-            ))
+            task_header = None
+            task_lines.clear()
         
-        print(f"  📊 Total epics found: {len(epics)}")
-        return epics
-
-    def _parse_all_tasks(self, content: str, sprint_number: int, sprint_name: str) -> List[Task]:
-        """Parse all tasks from sprint content"""
-        tasks = []
+        def sprint_number() -> Optional[int]:
+            """Number of the sprint, once its header has been read"""
+            return int(sprint_match.group(1)) if sprint_match else None
         
-        # Task pattern for format: **T*.*** - Task Title
-        task_pattern = r'\*\*T(\d+)\.(\d+)\*\* - (.+?)\n(.*?)(?=\*\*T\d+\.|\n### Epic|\Z)'
-        task_matches = re.finditer(task_pattern, content, re.DOTALL)
+        def close_goal():
+            """Finish the goal of the epic being read"""
+            nonlocal goal_lines
+            if goal_lines is not None:
+                current_epic.goal = "\n".join(goal_lines)
+                goal_lines = None
         
-        for task_match in task_matches:
-            sprint_id = task_match.group(1)
-            task_id = task_match.group(2)
-            task_title = task_match.group(3)
-            task_content = task_match.group(4)
-            
-            print(f"      🎯 Found task: T{sprint_id}.{task_id} - {task_title}")
+        for line_number, line in enumerate(content.splitlines(keepends=True), 1):
+            # Sprint metadata (first occurrence wins)
+            if sprint_match is None:
+                sprint_match = SPRINT_HEADER_PATTERN.search(line)
+            if layer_focus is None:
+                layer_focus_match = FOCUS_PATTERN.search(line)
+                if layer_focus_match:
+                    layer_focus = layer_focus_match.group(1)
+            if duration is None:
+                duration_match = DURATION_PATTERN.search(line)
+                if duration_match:
+                    duration = duration_match.group(1)
+            if story_points is None:
+                story_points_match = STORY_POINTS_TARGET_PATTERN.search(line)
+                if story_points_match:
+                    story_points = int(story_points_match.group(1))
             
-            # Parse task details
-            story_points = self._extract_story_points(task_content)
-            assignee = self._extract_assignee(task_content)
-            duration = self._extract_duration(task_content)
-            priority = self._extract_priority("🟡", task_content)  # Default priority
-            dependencies = self._extract_dependencies(task_content)
-            acceptance_criteria = self._extract_acceptance_criteria(task_content)
+            # An epic header opens its epic at the first non-blank line after it,
+            # which is normally the goal; an epic without one keeps an empty goal
+            if pending_epic_name is not None:
+                goal_match = EPIC_GOAL_PATTERN.match(line)
+                if not goal_match and not line.strip():
+                    continue
+                if current_epic is not None:
+                    yield sprint_number(), current_epic
+                sprint_name = sprint_match.group(2) if sprint_match else ""
+                current_epic = Epic(name=pending_epic_name, goal="", tasks=[], sprint=sprint_name)
+                epics.append(current_epic)
+                print(f"    📝 Found Epic {len(epics)}: {current_epic.name}")
+                pending_epic_name = None
+                if goal_match:
+                    goal_lines = [goal_match.group(1)]
+                    continue
+                print(f"    ⚠️  Epic {current_epic.name} has no **Goal** line; keeping it with an empty goal")
             
-            # Generate description
-            description = self._generate_task_description(
-                task_content, "TBD", sprint_name, dependencies, acceptance_criteria
-            )
+            if line.startswith("### Epic"):
+                close_goal()
+                close_task(trim_newline=True)
+                epic_match = EPIC_HEADER_PATTERN.match(line)
+                if epic_match:
+                    pending_epic_name = epic_match.group(2)
+                continue
             
-            task = Task(
-                id=f"T{sprint_id}.{task_id}",
-                title=task_title,
-                description=description,
-                story_points=story_points,
-                assignee=assignee,
-                duration=duration,
-                priority=priority,
-                dependencies=dependencies,
-                acceptance_criteria=acceptance_criteria,
-                epic="TBD",  # Will be assigned later
-                sprint=sprint_name
-            )
+            # Goal text runs until the first blank line
+            if goal_lines is not None:
+                if line.strip() and not TASK_BOUNDARY_PATTERN.search(line):
+                    goal_lines.append(line.rstrip("\n"))
+                    continue
+                close_goal()
             
-            tasks.append(task)
+            # Task blocks run until the next task marker, epic header or EOF
+            pos = 0
+            while True:
+                boundary = TASK_BOUNDARY_PATTERN.search(line, pos)
+                if boundary is None:
+                    if task_header is not None:
+                        task_lines.append(line[pos:])
+                    break
+                
+                if task_header is not None:
+                    task_lines.append(line[pos:boundary.start()])
+                close_task()
+                
+                header_match = TASK_HEADER_PATTERN.match(line, boundary.start())
+                if header_match:
+                    sprint_id, task_id, task_title = header_match.groups()
+                    print(f"      🎯 Found task: T{sprint_id}.{task_id} - {task_title}")
+                    task_header = (sprint_id, task_id, task_title)
+                    task_line = line_number
+                    break
+                pos = boundary.end()
         
-        return tasks
-
-    def _task_belongs_to_epic(self, content: str, task: Task, epic_start_pos: int, epic_end_pos: int) -> bool:
-        """Determine if a task belongs to an epic based on position in content"""
-        # Find task position in content
-        task_pattern = f"\\*\\*{re.escape(task.id)}\\*\\*"
-        task_match = re.search(task_pattern, content)
+        close_goal()
+        close_task()
+        if pending_epic_name is not None:
+            if current_epic is not None:
+                yield sprint_number(), current_epic
+            sprint_name = sprint_match.group(2) if sprint_match else ""
+            current_epic = Epic(name=pending_epic_name, goal="", tasks=[], sprint=sprint_name)
+            epics.append(current_epic)
+            print(f"    📝 Found Epic {len(epics)}: {current_epic.name}")
+            print(f"    ⚠️  Epic {current_epic.name} has no **Goal** line; keeping it with an empty goal")
+        if current_epic is not None:
+            yield sprint_number(), current_epic
         
-        if task_match:
-            task_pos = task_match.start()
-            return epic_start_pos <= task_pos < epic_end_pos
+        if not sprint_match:
+            raise ValueError(f"Could not parse sprint number from {file_path}")
         
-        return False
+        print(f"  📋 Found {task_count} total tasks in sprint")
+        for epic in epics:
+            print(f"    📋 Assigned {len(epic.tasks)} tasks to epic: {epic.name}")
+        print(f"  📊 Total epics found: {len(epics)}")
+        
+        return Sprint(
+            number=int(sprint_match.group(1)),
+            name=sprint_match.group(2),
+            layer_focus=layer_focus or "Unknown",
+            duration=duration or "14 days",
+            story_points=story_points or 0,
+            epics=epics
+        )
 
-    def _parse_tasks(self, epic_content: str, epic_name: str, sprint_number: int, sprint_name: str) -> List[Task]:
-        """Parse tasks from epic content"""
-        tasks = []
-        
-        # Updated task pattern to match multiple formats
-        patterns = [
-            # Format 1: **T*.*** priority_emoji Task Title
-            r'\*\*T(\d+)\.(\d+)\*\* (.+?) (.+?)\n(.+?)(?=\*\*T\d+\.|\n### |\Z)',
-            # Format 2: **T*.*** - Task Title (multiline content)
-            r'\*\*T(\d+)\.(\d+)\*\* - (.+?)\n(.*?)(?=\*\*T\d+\.|\n### |\Z)',
-            # Format 3: **T*.*** Task Title (without priority emoji, multiline)
-            r'\*\*T(\d+)\.(\d+)\*\* ([^-\n]+?)\n(.*?)(?=\*\*T\d+\.|\n### |\Z)'
-        ]
+    def _build_task(self, sprint_id: str, task_id: str, task_title: str,
+                    task_content: str, sprint_name: str) -> Task:
+        """Build a Task from a parsed task block"""
+        # Parse task details
+        story_points = self._extract_story_points(task_content)
+        assignee = self._extract_assignee(task_content)
+        duration = self._extract_duration(task_content)
+        priority = self._extract_priority("🟡", task_content)  # Default priority
+        dependencies = self._extract_dependencies(task_content)
+        acceptance_criteria = self._extract_acceptance_criteria(task_content)
         
-        total_matches = 0
-        for i, pattern in enumerate(patterns):
-            task_matches = re.finditer(pattern, epic_content, re.DOTALL)
-            for task_match in task_matches:
-                total_matches += 1
-                print(f"      🎯 Found task match (pattern {i+1}): {task_match.groups()[0:3]}")
-                
-                if i == 0:  # Format 1
-                    sprint_id = task_match.group(1)
-                    task_id = task_match.group(2)
-                    priority_emoji = task_match.group(3)
-                    task_title = task_match.group(4)
-                    task_content = task_match.group(5)
-                elif i == 1:  # Format 2  
-                    sprint_id = task_match.group(1)
-                    task_id = task_match.group(2)
-                    task_title = task_match.group(3)
-                    task_content = task_match.group(4)
-                    priority_emoji = "🟡"  # Default priority
-                else:  # Format 3
-                    sprint_id = task_match.group(1)
-                    task_id = task_match.group(2)
-                    task_title = task_match.group(3)
-                    task_content = task_match.group(4)
-                    priority_emoji = "🟡"  # Default priority
-                
-                # Parse task details
-                story_points = self._extract_story_points(task_content)
-                assignee = self._extract_assignee(task_content)
-                duration = self._extract_duration(task_content)
-                priority = self._extract_priority(priority_emoji, task_content)
-                dependencies = self._extract_dependencies(task_content)
-                acceptance_criteria = self._extract_acceptance_criteria(task_content)
-                
-                # Generate description
-                description = self._generate_task_description(
-                    task_content, epic_name, sprint_name, dependencies, acceptance_criteria
-                )
-                
-                task = Task(
-                    id=f"T{sprint_id}.{task_id}",
-                    title=task_title,
-                    description=description,
-                    story_points=story_points,
-                    assignee=assignee,
-                    duration=duration,
-                    priority=priority,
-                    dependencies=dependencies,
-                    acceptance_criteria=acceptance_criteria,
-                    epic=epic_name,
-                    sprint=sprint_name
-                )
-                
-                tasks.append(task)
-                print(f"        ✅ Created task: {task.id} - {task.title}")
+        # Generate description
+        description = self._generate_task_description(
+            task_content, "TBD", sprint_name, dependencies, acceptance_criteria
+        )
         
-        print(f"      📈 Total task matches found: {total_matches}")
-        print(f"      📋 Total tasks created: {len(tasks)}")
-        return tasks
+        return Task(
+            id=f"T{sprint_id}.{task_id}",
+            title=task_title,
+            description=description,
+            story_points=story_points,
+            assignee=assignee,
+            duration=duration,
+            priority=priority,
+            dependencies=dependencies,
+            acceptance_criteria=acceptance_criteria,
+            epic="TBD",  # Assigned when the task is attached to its epic
+            sprint=sprint_name
+        )
 
     def _extract_story_points(self, content: str) -> int:
         """Extract story points from task content"""
@@ -564,7 +1607,7 @@ class EAIOJiraAutomation:
         ]
         
         # Add raw content (cleaned up)
-        cleaned_content = re.sub(r'\*\*([^*]+)\*\*:', r'*\1*:', content)
+        cleaned_content = BOLD_LABEL_PATTERN.sub(r'*\1*:', content)
         description_parts.append(cleaned_content)
         
         # Add dependencies if any
@@ -585,45 +1628,215 @@ class EAIOJiraAutomation:
                 description_parts.append(f"* {criterion}")
         
         # Add architecture reference
-        description_parts.extend([
-            "",
-            "*Architecture References:*",
-            "* EAIO 6-Layer Architecture",
-            "* Cognitive Framework Implementation",
-            "* Task Management System"
-        ])
+        description_parts.append(ARCHITECTURE_REFERENCES)
         
         return "\n".join(description_parts)
 
     async def create_epic_in_jira(self, epic: Epic, sprint_number: int) -> str:
         """Create an epic in Jira and return its key"""
-        epic_key = self.jira_client.create_epic(epic, sprint_number)
+        project_key = self.jira_client.project_key
+        if self.journal is not None:
+            epic_key = self.journal.get_epic_key(project_key, sprint_number, epic.name)
+            if epic_key:
+                self.metrics.increment('epics_skipped')
+                self._log(f"  ⏭️  Epic already created: {epic_key} - {epic.name}")
+                return epic_key
+        
+        epic_key = await self._call_client(self.jira_client.create_epic, epic, sprint_number)
         if epic_key:
-            self.stats['epics_created'] += 1
-            print(f"  ✅ Created Epic: {epic_key} - {epic.name}")
+            if self.journal is not None:
+                self.journal.record_epic(project_key, sprint_number, epic.name, epic_key)
+            self.metrics.increment('epics_created')
+            self._log(f"  ✅ Created Epic: {epic_key} - {epic.name}")
             return epic_key
         else:
-            self.stats['epics_failed'] += 1
+            self.metrics.increment('epics_failed')
             print(f"  ❌ Failed to create Epic: {epic.name}")
             return ""
 
     async def create_task_in_jira(self, task: Task, epic_key: str) -> str:
         """Create a task in Jira and return its key"""
         if not epic_key:
-            self.stats['tasks_failed'] += 1
+            self.metrics.increment('tasks_failed')
             print(f"    ⚠️  Skipping {task.title} - no valid epic")
             return ""
+        
+        existing_key = await self._sync_existing_task(task, epic_key)
+        if existing_key:
+            return existing_key
             
-        task_key = self.jira_client.create_task(task, epic_key)
+        task_key = await self._call_client(self.jira_client.create_task, task, epic_key)
+        return self._record_task_result(task, task_key, epic_key)
+
+    async def _sync_existing_task(self, task: Task, epic_key: str) -> Optional[str]:
+        """Return the key of a task a previous run already created.
+
+        In sync mode the task is updated in Jira when its content hash
+        differs from the one journaled at the last sync.
+        """
+        if self.journal is None:
+            return None
+        project_key = self.jira_client.project_key
+        journaled = self.journal.get_task(project_key, task.id)
+        if journaled is None:
+            return None
+        
+        task_key, synced_hash = journaled
+        self._remember_task_key(task.id, task_key)
+        content_hash = task_content_hash(task)
+        if not self.sync_mode or synced_hash == content_hash:
+            self.metrics.increment('tasks_skipped')
+            self._log(f"    ⏭️  Task already created: {task_key} - {task.title}")
+            return task_key
+        
+        if await self._call_client(self.jira_client.update_task, task, task_key, epic_key):
+            self.journal.record_task(project_key, task.id, epic_key, task_key, content_hash)
+            self.metrics.increment('tasks_updated')
+            self._log(f"    🔄 Updated Task: {task_key} - {task.title}")
+        else:
+            self.metrics.increment('tasks_failed')
+            print(f"    ❌ Failed to update task: {task.id} - {task.title}")
+        return task_key
+
+    def _record_task_result(self, task: Task, task_key: Optional[str], epic_key: str) -> str:
+        """Update stats and the journal for a task creation attempt and return its key"""
         if task_key:
-            self.stats['tasks_created'] += 1
-            print(f"    ✅ Created Task: {task_key} - {task.title}")
+            self._remember_task_key(task.id, task_key)
+            if self.journal is not None:
+                self.journal.record_task(self.jira_client.project_key, task.id, epic_key, task_key,
+                                         task_content_hash(task))
+            self.metrics.increment('tasks_created')
+            self._log(f"    ✅ Created Task: {task_key} - {task.title}")
             return task_key
         else:
-            self.stats['tasks_failed'] += 1
+            self.metrics.increment('tasks_failed')
             print(f"    ❌ Failed to create task: {task.id} - {task.title}")
             return ""
 
+    async def create_tasks_in_jira(self, tasks: List[Task], epic_key: str) -> List[str]:
+        """Create an epic's tasks, up to max_concurrency at a time"""
+        # Without an epic, tasks take the per-task path and are counted as failed
+        if self.bulk_create and epic_key:
+            return await self._create_tasks_bulk(tasks, epic_key)
+        
+        async def create(task: Task) -> str:
+            async with self.task_semaphore:
+                return await self.create_task_in_jira(task, epic_key)
+        
+        return await asyncio.gather(*(create(task) for task in tasks))
+
+    async def _create_tasks_bulk(self, tasks: List[Task], epic_key: str) -> List[str]:
+        """Create an epic's tasks in bulk batches, up to max_concurrency batches at a time"""
+        async def sync_existing(task: Task) -> Optional[str]:
+            async with self.task_semaphore:
+                return await self._sync_existing_task(task, epic_key)
+        
+        existing_keys = await asyncio.gather(*(sync_existing(task) for task in tasks))
+        task_keys = {task.id: task_key for task, task_key in zip(tasks, existing_keys)}
+        pending = [task for task in tasks if not task_keys[task.id]]
+        
+        batch_size = self.jira_client.BULK_CREATE_LIMIT
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        async def create(batch: List[Task]):
+            async with self.task_semaphore:
+                batch_keys = await self._call_client(self.jira_client.create_tasks_bulk, batch, epic_key)
+                for task in batch:
+                    task_keys[task.id] = self._record_task_result(task, batch_keys.get(task.id), epic_key)
+        
+        await asyncio.gather(*(create(batch) for batch in batches))
+        return [task_keys[task.id] for task in tasks]
+
+    def build_dependency_graph(self, sprints: List[Sprint], touching: Optional[set] = None) -> DependencyGraph:
+        """Build the task dependency graph over all sprints and report cycles and unknown IDs.
+
+        With ``touching``, only problems involving those task IDs are reported.
+        """
+        graph = DependencyGraph.from_tasks(
+            task for sprint in sprints for epic in sprint.epics for task in epic.tasks
+        )
+        for task_id, missing in graph.dangling.items():
+            if touching is not None and task_id not in touching:
+                continue
+            entry = self.task_index.get(task_id) if self.task_index is not None else None
+            where = f" ({entry.location})" if entry is not None else ""
+            print(f"  ⚠️  {task_id}{where} depends on unknown task(s): {', '.join(missing)}")
+        for cycle in graph.cycles():
+            if touching is not None and touching.isdisjoint(cycle):
+                continue
+            print(f"  ⚠️  Dependency cycle, not linked: {' → '.join(cycle + cycle[:1])}")
+        return graph
+
+    def _remember_task_key(self, task_id: str, task_key: str):
+        """Record the Jira key of a task created or found during this run"""
+        self.task_keys[task_id] = task_key
+        if self.task_index is not None:
+            self.task_index.set_jira_key(task_id, task_key)
+
+    def _resolve_task_key(self, task_id: str) -> Optional[str]:
+        """Jira key of a task created in this run or recorded by an earlier one"""
+        task_key = self.task_keys.get(task_id)
+        if task_key is None and self.task_index is not None:
+            task_key = self.task_index.jira_key(task_id)
+        if task_key is None and self.journal is not None:
+            task_key = self.journal.get_task_key(self.jira_client.project_key, task_id)
+        return task_key
+
+    def build_task_index(self, sprints: List[Tuple[Sprint, Optional[Path]]]) -> TaskIndex:
+        """Index the parsed ``(sprint, source_file)`` pairs, with the Jira keys the journal already has"""
+        jira_keys = self.journal.task_keys(self.jira_client.project_key) if self.journal is not None else {}
+        self.task_index = TaskIndex.build(sprints, jira_keys)
+        return self.task_index
+
+    async def create_link_in_jira(self, blocker_id: str, blocked_id: str) -> bool:
+        """Create a "blocks" link between two tasks"""
+        project_key = self.jira_client.project_key
+        if self.journal is not None and self.journal.has_link(project_key, blocker_id, blocked_id):
+            self.metrics.increment('links_skipped')
+            return True
+        
+        blocker_key = self._resolve_task_key(blocker_id)
+        blocked_key = self._resolve_task_key(blocked_id)
+        if not blocker_key or not blocked_key:
+            self.metrics.increment('links_unresolved')
+            print(f"    ⏳ Not linked yet (task not in Jira): {blocker_id} → {blocked_id}")
+            return False
+        
+        if await self._call_client(self.jira_client.create_issue_link, blocker_key, blocked_key):
+            if self.journal is not None:
+                self.journal.record_link(project_key, blocker_id, blocked_id)
+            self.metrics.increment('links_created')
+            self._log(f"    🔗 Linked: {blocker_key} blocks {blocked_key}")
+            return True
+        else:
+            self.metrics.increment('links_failed')
+            return False
+
+    async def create_dependency_links(self, sprints: List[Sprint], touching: Optional[set] = None):
+        """Create "blocks" links for all task dependencies, one topological wave at a time.
+        
+        Links in a wave are created concurrently; dependencies across
+        sprints resolve through the task keys of this run and the journal.
+        The graph always spans ``sprints``; with ``touching``, only links to
+        or from those task IDs are created.
+        """
+        print("\n🔗 Linking task dependencies")
+        graph = self.build_dependency_graph(sprints, touching)
+        waves = graph.waves()
+        if touching is not None:
+            waves = [wave for wave in (
+                [edge for edge in wave if edge[0] in touching or edge[1] in touching] for wave in waves
+            ) if wave]
+        print(f"  {sum(len(wave) for wave in waves)} dependencies in {len(waves)} waves")
+        
+        async def link(blocker_id: str, blocked_id: str) -> bool:
+            async with self.task_semaphore:
+                return await self.create_link_in_jira(blocker_id, blocked_id)
+        
+        with self.metrics.phase('link_creation'):
+            for wave in waves:
+                await asyncio.gather(*(link(blocker_id, blocked_id) for blocker_id, blocked_id in wave))
+
     async def create_sprint_in_jira(self, sprint: Sprint) -> str:
         """Create a sprint in Jira and return its ID"""
         # Note: Sprint creation via API requires specific Jira permissions
@@ -633,58 +1846,206 @@ class EAIOJiraAutomation:
 
     async def process_all_sprints(self, sprints_directory: str = ".cursor/tasks/sprints"):
         """Process all sprint files and create them in Jira"""
-        sprints_path = Path(sprints_directory)
-        
-        if not sprints_path.exists():
-            print(f"❌ Sprints directory not found: {sprints_directory}")
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
             return
         
-        # Get all sprint files
-        sprint_files = sorted([f for f in sprints_path.glob("sprint_*.md")])
+        self.open_journal(sprints_directory)
+        self.load_project_metadata(sprints_directory)
         
         print(f"🎯 Found {len(sprint_files)} sprint files to process")
         print("=" * 60)
         
-        for sprint_file in sprint_files:
-            print(f"\n📋 Processing: {sprint_file.name}")
+        if self.pipeline:
+            # Sprints are not known before streaming starts, so the whole project is searched
+            self.preflight_existing_issues()
+            sprints = await self.stream_sprints(sprint_files)
+            self.build_task_index([(sprint, None) for sprint in sprints])
+            if self.link_dependencies:
+                await self.create_dependency_links(sprints)
+            print("\n" + "=" * 60)
+            print("🎉 EAIO Jira automation completed!")
+            self.write_metrics(sprints_directory)
+            return
+        
+        # Parse sprints (in parallel when PARSE_WORKERS > 1)
+        loaded = self._load_sprints(sprint_files)
+        sprints = [sprint for _, sprint in loaded]
+        self.build_task_index([(sprint, sprint_file) for sprint_file, sprint in loaded])
+        self.preflight_existing_issues(sprint.number for sprint in sprints)
+        
+        # Create epics and tasks in Jira, every epic of every sprint concurrently
+        print(f"\n📋 Processing {len(sprints)} sprints")
+        for sprint in await self.process_sprints(sprints):
+            self.metrics.increment('sprints_processed')
+        
+        if self.link_dependencies:
+            await self.create_dependency_links(sprints)
+        
+        print("\n" + "=" * 60)
+        print("🎉 EAIO Jira automation completed!")
+        self.write_metrics(sprints_directory)
+
+    async def resync_tasks(self, selectors: List[str], sprints_directory: str = ".cursor/tasks/sprints") -> List[str]:
+        """Sync only the selected tasks: task IDs, 'assignee=<role>' or 'priority=<level>'.
+
+        The task index finds each task's epic without scanning the plan;
+        missing epics and tasks are created, changed tasks are updated and
+        unchanged ones are skipped, as in sync mode. Returns the Jira keys.
+        """
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
+            return []
+        
+        self.sync_mode = True
+        self.open_journal(sprints_directory)
+        self.load_project_metadata(sprints_directory)
+        
+        index = self.build_task_index([(sprint, sprint_file) for sprint_file, sprint in self._load_sprints(sprint_files)])
+        
+        entries = index.select(selectors)
+        print(f"🎯 {len(entries)} of {len(index)} tasks selected by {', '.join(selectors)}")
+        self.preflight_existing_issues({entry.sprint_number for entry in entries})
+        
+        # Each epic is looked up (or created) once for all of its selected tasks
+        by_epic: Dict[int, List] = {}
+        for entry in entries:
+            by_epic.setdefault(id(entry.epic), []).append(entry)
+        
+        async def sync_epic(epic_entries: List) -> List[str]:
+            first = epic_entries[0]
+            async with self.task_semaphore:
+                epic_key = await self.create_epic_in_jira(first.epic, first.sprint_number)
+            return await self.create_tasks_in_jira([entry.task for entry in epic_entries], epic_key)
+        
+        with self.metrics.phase('task_creation'):
+            results = await asyncio.gather(*(sync_epic(epic_entries) for epic_entries in by_epic.values()))
+        self.write_metrics(sprints_directory)
+        return [task_key for epic_keys in results for task_key in epic_keys]
+
+    async def watch(self, sprints_directory: str = ".cursor/tasks/sprints", watcher: Optional[SprintWatcher] = None):
+        """Keep Jira in step with the sprint files until interrupted.
+
+        Runs in sync mode: each time a burst of edits settles, only the
+        changed files are re-parsed, and only their new or changed tasks are
+        sent to Jira; unchanged ones are skipped through the journal.
+        Dependencies are resolved against the whole plan, parsed once at
+        start, so links to tasks of unchanged sprints are still created.
+        """
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
+            return
+        sprints_path = Path(sprints_directory)
+        
+        self.sync_mode = True
+        self.open_journal(sprints_directory)
+        self.load_project_metadata(sprints_directory)
+        
+        # Latest parse of every sprint file, for dependencies across sprints
+        plan: Dict[Path, Sprint] = {}
+        if self.link_dependencies:
+            plan.update(self._load_sprints(sprint_files, workers=0))
+        self.preflight_existing_issues(sprint.number for sprint in plan.values())
+        
+        watcher = watcher or SprintWatcher(sprints_path)
+        print(f"👀 Watching {sprints_path} ({watcher.backend}, {watcher.debounce:g}s debounce) - Ctrl+C to stop")
+        async for changed_files in watcher.changes():
+            before = self.stats
+            loaded = self._load_sprints(changed_files, workers=0)
+            plan.update(loaded)
+            sprints = [sprint for _, sprint in loaded]
             
-            try:
-                # Parse sprint
-                sprint = self.parse_sprint_file(sprint_file)
-                
-                # Create sprint in Jira
-                sprint_id = await self.create_sprint_in_jira(sprint)
-                
-                if not sprint_id:
-                    print(f"⚠️  Skipping {sprint.name} due to sprint creation failure")
-                    continue
-                
-                # Process each epic in the sprint
-                for epic in sprint.epics:
-                    print(f"\n  📁 Creating Epic: {epic.name}")
-                    
-                    # Create epic
-                    epic_key = await self.create_epic_in_jira(epic, sprint.number)
+            for sprint in await self.process_sprints(sprints):
+                self.metrics.increment('sprints_processed')
+            if self.link_dependencies and sprints:
+                changed_tasks = {task.id for sprint in sprints for epic in sprint.epics for task in epic.tasks}
+                await self.create_dependency_links(list(plan.values()), touching=changed_tasks)
+            
+            delta = {name: value - before.get(name, 0) for name, value in self.stats.items()}
+            print(f"🔄 Synced {', '.join(f.name for f in changed_files)}: {delta['tasks_created']} created, "
+                  f"{delta['tasks_updated']} updated, {delta['tasks_skipped']} unchanged, "
+                  f"{delta['tasks_failed'] + delta['epics_failed']} failed")
+            self.write_metrics(sprints_directory)
+
+    async def stream_sprints(self, sprint_files: List[Path]) -> List[Sprint]:
+        """Create epics and tasks while the sprint files are still being parsed.
+
+        The parser feeds a bounded queue with each epic as soon as its
+        section is complete, followed by its tasks; ``max_concurrency``
+        workers consume the queue. Every epic carries a future that resolves
+        to its Jira key, and a task waits only on its own epic's future.
+        Returns the parsed sprints.
+        """
+        self._warn_unsharded("the streaming pipeline")
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        sprints: List[Sprint] = []
+        
+        async def produce():
+            for sprint_file in sprint_files:
+                print(f"\n📋 Processing: {sprint_file.name}")
+                sections = self.iter_sprint_file(sprint_file)
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        sprint_number, epic = next(sections)
+                    except StopIteration as finished:
+                        sprint = finished.value
+                        sprints.append(sprint)
+                        self.metrics.increment('sprints_processed')
+                        print(f"✅ Queued Sprint {sprint.number}: {len(sprint.epics)} epics, "
+                              f"{sum(len(epic.tasks) for epic in sprint.epics)} tasks")
+                        break
+                    except Exception as e:
+                        print(f"❌ Error processing {sprint_file.name}: {str(e)}")
+                        break
+                    finally:
+                        self.metrics.add_phase_time('parse', time.perf_counter() - start)
                     
-                    if not epic_key:
-                        print(f"    ⚠️  Skipping tasks for epic {epic.name}")
+                    # Without a sprint header the file fails once fully parsed
+                    if sprint_number is None:
                         continue
                     
-                    # Create tasks for this epic
-                    for task in epic.tasks:
-                        await self.create_task_in_jira(task, epic_key)
-                        await asyncio.sleep(self.rate_limit_delay)  # Rate limiting
-                
-                self.stats['sprints_processed'] += 1
-                total_tasks = sum(len(e.tasks) for e in sprint.epics)
-                print(f"✅ Completed Sprint {sprint.number}: {len(sprint.epics)} epics, {total_tasks} tasks")
-                
-            except Exception as e:
-                print(f"❌ Error processing {sprint_file.name}: {str(e)}")
-                continue
+                    if self.progress is not None:
+                        self.progress.add(1 + len(epic.tasks))
+                    epic_key = loop.create_future()
+                    await queue.put(('epic', epic, sprint_number, epic_key))
+                    if self.bulk_create:
+                        await queue.put(('tasks', epic.tasks, epic_key))
+                    else:
+                        for task in epic.tasks:
+                            await queue.put(('task', task, epic_key))
+            
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
         
-        print("\n" + "=" * 60)
-        print("🎉 EAIO Jira automation completed!")
+        async def consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                kind = item[0]
+                try:
+                    if kind == 'epic':
+                        _, epic, sprint_number, epic_key = item
+                        self._log(f"\n  📁 Creating Epic: {epic.name}")
+                        try:
+                            epic_key.set_result(await self.create_epic_in_jira(epic, sprint_number))
+                        finally:
+                            if not epic_key.done():
+                                epic_key.set_result("")
+                    elif kind == 'tasks':
+                        _, tasks, epic_key = item
+                        await self.create_tasks_in_jira(tasks, await epic_key)
+                    else:
+                        _, task, epic_key = item
+                        await self.create_task_in_jira(task, await epic_key)
+                except Exception as e:
+                    print(f"❌ Error creating {kind}: {str(e)}")
+        
+        with self.metrics.phase('streaming'), self.live_progress([]):
+            await asyncio.gather(produce(), *(consume() for _ in range(self.max_concurrency)))
+        return sprints
 
     async def create_summary_dashboard(self):
         """Create a summary dashboard issue for tracking"""
@@ -748,67 +2109,382 @@ class EAIOJiraAutomation:
 * Portfolio management
 """
 
-    async def process_single_sprint(self, sprint: Sprint):
+    async def process_single_sprint(self, sprint: Sprint) -> bool:
         """Process a single sprint and create epics/tasks in Jira"""
-        # Create sprint in Jira (manual for now)
-        sprint_id = await self.create_sprint_in_jira(sprint)
+        return bool(await self.process_sprints([sprint]))
+
+    async def process_sprints(self, sprints: List[Sprint]) -> List[Sprint]:
+        """Create the epics and tasks of several sprints, returning the sprints processed.
+
+        All epics are scheduled at once; each epic's tasks are released as
+        soon as that epic's key is known, so the run takes as long as the
+        slowest epic plus its tasks rather than the sum over all epics.
+        """
+        scheduled = []
+        for sprint in sprints:
+            # Create sprint in Jira (manual for now)
+            sprint_id = await self.create_sprint_in_jira(sprint)
+            
+            if not sprint_id:
+                print(f"⚠️  Skipping {sprint.name} due to sprint creation failure")
+                continue
+            scheduled.append(sprint)
         
-        if not sprint_id:
-            print(f"⚠️  Skipping {sprint.name} due to sprint creation failure")
-            return
+        shards = self.shards()
+        with self.live_progress(scheduled):
+            if shards:
+                jobs = self._shard_epics(scheduled, shards)
+            else:
+                jobs = [(self, sprint.number, epic) for sprint in scheduled for epic in sprint.epics]
+            try:
+                results = await asyncio.gather(*(
+                    automation._create_epic_with_tasks(epic, sprint_number) for automation, sprint_number, epic in jobs
+                ), return_exceptions=True)
+            finally:
+                for shard in shards:
+                    shard.progress = None
         
-        # Process each epic in the sprint
-        for epic in sprint.epics:
-            print(f"\n  📁 Creating Epic: {epic.name}")
-            
-            # Create epic
-            epic_key = await self.create_epic_in_jira(epic, sprint.number)
-            
-            if not epic_key:
-                print(f"    ⚠️  Skipping tasks for epic {epic.name}")
+        # An error in one epic (e.g. a journal write) leaves the other epics running to completion
+        failed_sprints = set()
+        for (_, sprint_number, epic), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error processing epic {epic.name} (Sprint {sprint_number}): {str(result)}")
+                failed_sprints.add(sprint_number)
+        
+        processed = []
+        for sprint in scheduled:
+            if sprint.number in failed_sprints:
+                print(f"⚠️  Sprint {sprint.number} incomplete: see the errors above")
                 continue
+            print(f"✅ Completed Sprint {sprint.number}: {len(sprint.epics)} epics, {sum(len(epic.tasks) for epic in sprint.epics)} tasks")
+            processed.append(sprint)
+        return processed
+
+    async def _create_epic_with_tasks(self, epic: Epic, sprint_number: int):
+        """Create an epic, then its tasks once the epic's key is known"""
+        self._log(f"\n  📁 Creating Epic: {epic.name}")
+        async with self.task_semaphore:
+            with self.metrics.phase('epic_creation'):
+                epic_key = await self.create_epic_in_jira(epic, sprint_number)
+        
+        # Tasks of a failed epic are skipped and counted as failed
+        if not epic_key:
+            print(f"    ⚠️  Skipping tasks for epic {epic.name}")
+        
+        with self.metrics.phase('task_creation'):
+            await self.create_tasks_in_jira(epic.tasks, epic_key)
+
+    def plan_run(self, sprints: List[Sprint], assumed_latency: float = 0.3) -> Dict:
+        """Build every payload a run would send and count its HTTP calls, without sending anything.
+
+        Journaled epics/tasks are skipped and changed tasks are updated in
+        sync mode, exactly as process_single_sprint would do.
+        """
+        client = self.jira_client
+        project_key = client.project_key
+        plan = {
+            'sprints': len(sprints),
+            'epics_to_create': 0,
+            'epics_existing': 0,
+            'tasks_to_create': 0,
+            'tasks_to_update': 0,
+            'tasks_existing': 0,
+            'epic_calls': 0,
+            'task_calls': 0,
+            'bulk_batches': 0,
+            'update_calls': 0,
+            'link_calls': 0,
+            'payload_bytes': 0
+        }
+        
+        # Field discovery runs unless the metadata cache has the project;
+        # the preflight search takes one page per PREFLIGHT_PAGE_SIZE issues
+        plan['discovery_calls'] = DISCOVERY_CALLS if self.field_discovery and self.jira_client.metadata is None else 0
+        plan['preflight_calls'] = 1 if self.preflight else 0
+        
+        # Each phase is a number of calls that may run concurrently; all
+        # epics are created at once, then the tasks they release
+        epic_calls = 0
+        task_calls = 0
+        
+        for sprint in sprints:
+            for epic in sprint.epics:
+                epic_key = self.journal.get_epic_key(project_key, sprint.number, epic.name) if self.journal else None
+                if epic_key:
+                    plan['epics_existing'] += 1
+                else:
+                    plan['epics_to_create'] += 1
+                    plan['epic_calls'] += 1
+                    plan['payload_bytes'] += client.body_size(client._build_epic_payload(epic, sprint.number))
+                    epic_calls += 1
+                    epic_key = f"{project_key}-0"
+                
+                new_tasks = []
+                updates = 0
+                for task in epic.tasks:
+                    journaled = self.journal.get_task(project_key, task.id) if self.journal else None
+                    if journaled is None:
+                        new_tasks.append(task)
+                    elif self.sync_mode and journaled[1] != task_content_hash(task):
+                        updates += 1
+                        plan['payload_bytes'] += client.body_size(client._build_task_update_payload(task, epic_key))
+                    else:
+                        plan['tasks_existing'] += 1
+                
+                plan['tasks_to_create'] += len(new_tasks)
+                plan['tasks_to_update'] += updates
+                plan['update_calls'] += updates
+                
+                # Bodies are sized as sent: one per bulk batch, compressed as a whole
+                if self.bulk_create:
+                    batches = math.ceil(len(new_tasks) / client.BULK_CREATE_LIMIT)
+                    for start in range(0, len(new_tasks), client.BULK_CREATE_LIMIT):
+                        plan['payload_bytes'] += client.body_size({"issueUpdates": [
+                            client._build_task_payload(task, epic_key)
+                            for task in new_tasks[start:start + client.BULK_CREATE_LIMIT]
+                        ]})
+                    plan['bulk_batches'] += batches
+                    plan['task_calls'] += batches
+                    task_calls += updates + batches
+                else:
+                    plan['payload_bytes'] += sum(client.body_size(client._build_task_payload(task, epic_key))
+                                                 for task in new_tasks)
+                    plan['task_calls'] += len(new_tasks)
+                    task_calls += len(new_tasks) + updates
+        
+        phases = [1] * (plan['discovery_calls'] + plan['preflight_calls']) + [epic_calls, task_calls]
+        if self.link_dependencies:
+            graph = self.build_dependency_graph(sprints)
+            for wave in graph.waves():
+                new_links = [
+                    (blocker_id, blocked_id) for blocker_id, blocked_id in wave
+                    if not (self.journal and self.journal.has_link(project_key, blocker_id, blocked_id))
+                ]
+                plan['link_calls'] += len(new_links)
+                plan['payload_bytes'] += len(new_links) * client.body_size(
+                    client._build_issue_link_payload(f"{project_key}-0", f"{project_key}-0"))
+                phases.append(len(new_links))
+            plan['dependency_cycles'] = len(graph.cycles())
+            plan['dangling_dependencies'] = sum(len(missing) for missing in graph.dangling.values())
+        
+        plan['http_calls'] = (plan['discovery_calls'] + plan['preflight_calls'] + plan['epic_calls']
+                              + plan['task_calls'] + plan['update_calls'] + plan['link_calls'])
+        plan['estimated_seconds'] = self._estimate_duration(phases, assumed_latency)
+        plan['assumed_latency'] = assumed_latency
+        return plan
+
+    def _estimate_duration(self, phases: List[int], latency: float) -> float:
+        """Project wall-clock seconds for sequential phases of concurrent calls.
+
+        Calls are spaced by the adaptive limiter's rate, which grows by its
+        increase step per healthy response, or by latency / max_concurrency
+        when the in-flight limit is the bottleneck.
+        """
+        limiter = self.rate_limiter
+        rate = limiter.rate
+        elapsed = 0.0
+        for calls in phases:
+            if not calls:
+                continue
+            for _ in range(calls):
+                elapsed += max(1.0 / rate, latency / self.max_concurrency)
+                rate = min(limiter.max_rate, rate + limiter.increase_step)
             
-            # Create tasks for this epic
-            for task in epic.tasks:
-                await self.create_task_in_jira(task, epic_key)
-                await asyncio.sleep(self.rate_limit_delay)  # Rate limiting
+            # The phase ends when its last response arrives
+            elapsed += latency
+        return elapsed
+
+    def print_run_plan(self, plan: Dict):
+        """Print a dry-run plan"""
+        minutes, seconds = divmod(int(round(plan['estimated_seconds'])), 60)
+        print("\n📋 Dry run plan (nothing sent to Jira)")
+        print("=" * 60)
+        print(f"  Project: {self.jira_client.project_key}")
+        print(f"  Sprints: {plan['sprints']}")
+        print(f"  Epics: {plan['epics_to_create']} to create, {plan['epics_existing']} already in Jira")
+        print(f"  Tasks: {plan['tasks_to_create']} to create, {plan['tasks_to_update']} to update, "
+              f"{plan['tasks_existing']} already in Jira")
+        print(f"  HTTP calls: {plan['http_calls']}")
+        if plan['discovery_calls']:
+            print(f"    - Field discovery: {plan['discovery_calls']}")
+        if plan['preflight_calls']:
+            print(f"    - Preflight search: {plan['preflight_calls']} "
+                  f"(+1 per {self.jira_client.PREFLIGHT_PAGE_SIZE} issues already in the project)")
+        print(f"    - Epic creation: {plan['epic_calls']}")
+        if self.bulk_create:
+            print(f"    - Task creation: {plan['task_calls']} ({plan['bulk_batches']} bulk batches)")
+        else:
+            print(f"    - Task creation: {plan['task_calls']}")
+        print(f"    - Task updates: {plan['update_calls']}")
+        print(f"    - Issue links: {plan['link_calls']}")
+        if plan.get('dependency_cycles') or plan.get('dangling_dependencies'):
+            print(f"  Dependency problems: {plan['dependency_cycles']} cycles, "
+                  f"{plan['dangling_dependencies']} unknown task IDs (not linked)")
+        if plan['discovery_calls']:
+            # Custom fields (story points, epic parent) are added to the payloads once discovered
+            print(f"  Payload size: ~{plan['payload_bytes'] / 1024:.1f} KB estimated, without the custom fields "
+                  f"discovered at run time")
+        else:
+            print(f"  Payload size: ~{plan['payload_bytes'] / 1024:.1f} KB estimated")
+        print(f"  Estimated time: {minutes}m {seconds:02d}s "
+              f"(start {self.rate_limiter.rate:.2f} req/s, max {self.rate_limiter.max_rate:.0f} req/s, "
+              f"{self.max_concurrency} in flight, {plan['assumed_latency']:.2f}s assumed latency)")
+
+    def dry_run(self, sprints_directory: str, assumed_latency: float = 0.3) -> Optional[Dict]:
+        """Parse all sprints and report the run plan without contacting Jira"""
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
+            return None
+        
+        # Read the journal and field metadata only if a previous run left them
+        self.open_journal(sprints_directory, create=False)
+        self.load_project_metadata(sprints_directory, fetch=False)
         
-        print(f"✅ Completed Sprint {sprint.number}: {len(sprint.epics)} epics, {sum(len(epic.tasks) for epic in sprint.epics)} tasks")
+        sprints = [sprint for _, sprint in self._load_sprints(sprint_files)]
+        
+        plan = self.plan_run(sprints, assumed_latency)
+        self.print_run_plan(plan)
+        return plan
+
+    def _iter_plan_sections(self, sprint_files: List[Path], report_errors: bool = True) -> Generator[Tuple[int, Epic], None, None]:
+        """Stream ``(sprint_number, epic)`` over several sprint files, skipping files that fail to parse"""
+        for sprint_file in sprint_files:
+            try:
+                for sprint_number, epic in self.iter_sprint_file(sprint_file):
+                    if sprint_number is not None:
+                        yield sprint_number, epic
+            except Exception as e:
+                if report_errors:
+                    print(f"❌ Error processing {sprint_file.name}: {str(e)}")
+
+    def export_import_bundle(self, sprints_directory: str, output_directory: Optional[str] = None) -> Optional[Path]:
+        """Write the plan as a Jira CSV-importer file and a JSON Lines dump, returning the CSV path.
+
+        A first, quiet pass assigns Issue Ids (needed for dependency columns
+        that point forward); the second streams each issue to disk as it
+        is parsed. Output goes next to the sprints directory by default.
+        """
+        sprint_files = self._sprint_files(sprints_directory)
+        if sprint_files is None:
+            return None
+        output_path = Path(output_directory) if output_directory else Path(sprints_directory).parent
+        
+        with self.metrics.phase('parse'), contextlib.redirect_stdout(io.StringIO()):
+            plan = IssueIdPlan.from_sections(self._iter_plan_sections(sprint_files, report_errors=False))
+        
+        with self.metrics.phase('export'), ImportBundleWriter(output_path, plan.max_blockers) as writer:
+            for record in export_records(self._iter_plan_sections(sprint_files), plan):
+                writer.write(record)
+                for blocker in record.get('unknown_dependencies', []):
+                    print(f"  ⚠️  {record['task_id']} depends on unknown task: {blocker}")
+        
+        print(f"📦 Exported {writer.written} issues from {len(sprint_files)} sprint files")
+        print(f"   CSV (Jira importer): {writer.csv_path}")
+        print(f"   JSON Lines: {writer.jsonl_path}")
+        return writer.csv_path
 
     def _get_sprints_path(self, sprints_directory: str):
         """Get the path to sprints directory"""
         from pathlib import Path
         return Path(sprints_directory)
 
+# Parser reused by each sprint-parsing worker process
+_worker_automation: Optional[EAIOJiraAutomation] = None
+
+def _parse_sprint_file_worker(file_path: str) -> Dict:
+    """Process-pool entry point: parse one sprint file into plain data"""
+    global _worker_automation
+    if _worker_automation is None:
+        _worker_automation = EAIOJiraAutomation("", "", "")
+    
+    # Per-task progress lines from parallel workers would interleave
+    with contextlib.redirect_stdout(io.StringIO()):
+        sprint = _worker_automation.parse_sprint_file(Path(file_path))
+    return sprint_to_dict(sprint)
+
 def main():
     """Main function to run the automation"""
     import argparse
     
     parser = argparse.ArgumentParser(description="EAIO Jira Automation")
-    parser.add_argument("--jira-url", required=True, help="Jira URL (e.g., https://fistdat.atlassian.net)")
-    parser.add_argument("--email", required=True, help="Jira email")
-    parser.add_argument("--api-token", required=True, help="Jira API token")
+    parser.add_argument("--jira-url", default=os.getenv('ATLASSIAN_URL'), help="Jira URL (e.g., https://fistdat.atlassian.net)")
+    parser.add_argument("--email", default=os.getenv('ATLASSIAN_EMAIL'), help="Jira email")
+    parser.add_argument("--api-token", default=os.getenv('ATLASSIAN_API_TOKEN'), help="Jira API token")
     parser.add_argument("--project-key", default="SCRUM", help="Jira project key")
+    parser.add_argument("--projects", help="Comma-separated project keys to create the plan in concurrently (e.g. SCRUM,SMMG6)")
     parser.add_argument("--sprints-dir", default=".cursor/tasks/sprints", help="Sprints directory")
     parser.add_argument("--dry-run", action="store_true", help="Parse only, don't create in Jira")
+    parser.add_argument("--async-client", action="store_true", help="Use the pooled aiohttp client")
+    parser.add_argument("--threads", action="store_true", help="Run the blocking client on a pool of worker threads")
+    parser.add_argument("--max-concurrency", type=int, help="Maximum in-flight requests for the async client or thread pool")
+    parser.add_argument("--bulk", action="store_true", help="Create tasks with bulk requests of up to 50 issues")
+    parser.add_argument("--sync", action="store_true", help="Update journaled tasks whose content changed")
+    parser.add_argument("--pipeline", action="store_true", help="Create issues while sprint files are still being parsed")
+    parser.add_argument("--link-dependencies", action="store_true", help="Create \"blocks\" links from task dependencies")
+    parser.add_argument("--progress", action="store_true", help="Show a live progress view with rate and ETA")
+    parser.add_argument("--watch", action="store_true", help="Keep running and sync sprint files to Jira whenever they change")
+    parser.add_argument("--shard-credentials",
+                        help="Split epics across these service accounts: comma-separated email:token pairs, or @file with one per line")
+    parser.add_argument("--only", help="Sync only these tasks: comma-separated task IDs, assignee=<role> or priority=<level>")
+    parser.add_argument("--export", metavar="DIR", nargs="?", const="",
+                        help="Write a Jira CSV import file and JSON Lines dump (default: next to the sprints directory) instead of calling Jira")
+    parser.add_argument("--assumed-latency", type=float, default=0.3, help="Per-request latency (seconds) for dry-run time estimates")
     
     args = parser.parse_args()
     
+    # Dry runs and exports never contact Jira, so credentials are optional there
+    if not args.dry_run and args.export is None and not all([args.jira_url, args.email, args.api_token]):
+        parser.error("--jira-url, --email and --api-token are required (or set ATLASSIAN_URL, ATLASSIAN_EMAIL, ATLASSIAN_API_TOKEN)")
+    
     # Initialize automation
     automation = EAIOJiraAutomation(
-        jira_url=args.jira_url,
-        email=args.email,
-        api_token=args.api_token,
-        project_key=args.project_key
+        jira_url=args.jira_url or "",
+        email=args.email or "",
+        api_token=args.api_token or "",
+        project_key=args.project_key,
+        async_client=args.async_client or None,
+        thread_pool=args.threads or None,
+        max_concurrency=args.max_concurrency,
+        bulk_create=args.bulk or None,
+        sync_mode=args.sync or None,
+        link_dependencies=args.link_dependencies or None,
+        pipeline=args.pipeline or None
     )
+    if args.progress:
+        automation.show_progress = True
+    if args.shard_credentials:
+        automation.shard_credentials = parse_credentials(args.shard_credentials)
     
-    if args.dry_run:
+    async def run():
+        try:
+            if args.projects:
+                await automation.process_projects(args.projects.split(","), args.sprints_dir)
+                return
+            if args.watch:
+                await automation.watch(args.sprints_dir)
+                return
+            if args.only:
+                await automation.resync_tasks(args.only.split(","), args.sprints_dir)
+                print(f"📈 Statistics: {automation.stats}")
+                return
+            await automation.process_all_sprints(args.sprints_dir)
+            await automation.create_summary_dashboard()
+        finally:
+            await automation.close()
+    
+    if args.export is not None:
+        automation.export_import_bundle(args.sprints_dir, args.export or None)
+    elif args.dry_run:
         print("🔍 DRY RUN MODE - Parsing sprints only")
-        # Add dry run logic here
+        automation.dry_run(args.sprints_dir, args.assumed_latency)
+        if automation.journal is not None:
+            automation.journal.close()
     else:
         # Run the automation
-        asyncio.run(automation.process_all_sprints(args.sprints_dir))
-        asyncio.run(automation.create_summary_dashboard())
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopped")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Import Bundle
+Jira CSV-importer file and JSON Lines dump of a parsed sprint plan
+
+Every epic and task becomes one row with an ``Issue Id``; tasks point to
+their epic through ``Parent`` and to the tasks they depend on through
+``Inward issue link (Blocks)`` columns, the headers Jira's CSV importer
+maps to parent and "is blocked by" links. Rows are written as they are
+produced, so the plan never has to be held in memory.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from task_dependencies import TASK_ID_PATTERN
+
+CSV_FILENAME = "jira_import.csv"
+JSONL_FILENAME = "jira_import.jsonl"
+
+# Columns Jira's CSV importer maps automatically
+CSV_COLUMNS = ("Issue Id", "Issue Type", "Summary", "Description", "Priority",
+               "Story Points", "Parent", "Epic Name", "Labels")
+
+# One column per blocking task; the importer links the row's issue as "is blocked by"
+BLOCKED_BY_COLUMN = "Inward issue link (Blocks)"
+
+
+class IssueIdPlan:
+    """Issue Ids assigned in plan order, and the most blockers any task has"""
+
+    def __init__(self):
+        """Initialize an empty plan"""
+        self.task_ids: Dict[str, int] = {}
+        self.issues = 0
+        self.max_blockers = 0
+
+    @classmethod
+    def from_sections(cls, sections: Iterable[Tuple[int, object]]) -> "IssueIdPlan":
+        """Number every epic and task of ``(sprint_number, epic)`` sections"""
+        plan = cls()
+        for _, epic in sections:
+            plan.issues += 1
+            for task in epic.tasks:
+                plan.issues += 1
+                plan.task_ids.setdefault(task.id, plan.issues)
+                plan.max_blockers = max(plan.max_blockers, len(_blockers(task)))
+        return plan
+
+
+def _blockers(task) -> List[str]:
+    """Task IDs a task depends on, in order and without repeats"""
+    blockers: List[str] = []
+    for dependency in task.dependencies:
+        for blocker in TASK_ID_PATTERN.findall(dependency):
+            if blocker not in blockers and blocker != task.id:
+                blockers.append(blocker)
+    return blockers
+
+
+def export_records(sections: Iterable[Tuple[int, object]], plan: IssueIdPlan) -> Iterator[Dict]:
+    """Import records for ``(sprint_number, epic)`` sections, numbered like ``plan``"""
+    issue_id = 0
+    for sprint_number, epic in sections:
+        issue_id += 1
+        epic_id = issue_id
+        label = f"Sprint-{sprint_number}"
+        yield {
+            'issue_id': epic_id,
+            'issue_type': "Epic",
+            'summary': f"Sprint {sprint_number}: {epic.name}",
+            'description': f"Epic Goal: {epic.goal}\n\nSprint: {epic.sprint}\nTotal Tasks: {len(epic.tasks)}",
+            'priority': None,
+            'story_points': None,
+            'parent_id': None,
+            'epic_name': epic.name,
+            'labels': [label],
+            'sprint_number': sprint_number,
+        }
+        for task in epic.tasks:
+            issue_id += 1
+            blockers = _blockers(task)
+            yield {
+                'issue_id': issue_id,
+                'issue_type': "Task",
+                'summary': f"{task.id}: {task.title}",
+                'description': task.description,
+                'priority': task.priority,
+                'story_points': task.story_points,
+                'parent_id': epic_id,
+                'epic_name': None,
+                'labels': [label],
+                'sprint_number': sprint_number,
+                'task_id': task.id,
+                'assignee': task.assignee,
+                'blocked_by': [plan.task_ids[blocker] for blocker in blockers if blocker in plan.task_ids],
+                'unknown_dependencies': [blocker for blocker in blockers if blocker not in plan.task_ids],
+            }
+
+
+class ImportBundleWriter:
+    """Writes import records to the CSV and JSON Lines files of a directory"""
+
+    def __init__(self, directory: Path, link_columns: int):
+        """Initialize with the output directory and the number of blocker columns"""
+        self.directory = Path(directory)
+        self.link_columns = link_columns
+        self.csv_path = self.directory / CSV_FILENAME
+        self.jsonl_path = self.directory / JSONL_FILENAME
+        self.written = 0
+        self._csv_file = None
+        self._jsonl_file = None
+        self._csv: Optional[csv.writer] = None
+
+    def __enter__(self) -> "ImportBundleWriter":
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._csv_file = open(self.csv_path, 'w', encoding='utf-8', newline='')
+        self._jsonl_file = open(self.jsonl_path, 'w', encoding='utf-8')
+        self._csv = csv.writer(self._csv_file)
+        self._csv.writerow(CSV_COLUMNS + (BLOCKED_BY_COLUMN,) * self.link_columns)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._csv_file.close()
+        self._jsonl_file.close()
+
+    def write(self, record: Dict):
+        """Append one issue to both files"""
+        blocked_by = record.get('blocked_by', [])
+        row = [
+            record['issue_id'],
+            record['issue_type'],
+            record['summary'],
+            record['description'],
+            record['priority'] or "",
+            "" if record['story_points'] is None else record['story_points'],
+            record['parent_id'] or "",
+            record['epic_name'] or "",
+            " ".join(record['labels']),
+        ]
+        row += blocked_by + [""] * (self.link_columns - len(blocked_by))
+        self._csv.writerow(row)
+        self._jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.written += 1
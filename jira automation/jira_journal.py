@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Run Journal
+SQLite record of the epics and tasks already created in Jira
+
+Each creation is written as soon as Jira acknowledges it, so an
+interrupted run can be repeated without creating duplicates: completed
+items are skipped and only the remainder is sent. Tasks also keep the
+hash of the content last sent, so sync runs only update changed tasks,
+and dependency links are recorded so they are never created twice.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Journal file written next to the sprints directory
+JOURNAL_FILENAME = "jira_run_journal.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS epics (
+    project_key TEXT NOT NULL,
+    sprint_number INTEGER NOT NULL,
+    epic_name TEXT NOT NULL,
+    jira_key TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (project_key, sprint_number, epic_name)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    project_key TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    epic_key TEXT NOT NULL,
+    jira_key TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    content_hash TEXT,
+    PRIMARY KEY (project_key, task_id)
+);
+CREATE TABLE IF NOT EXISTS links (
+    project_key TEXT NOT NULL,
+    blocker_id TEXT NOT NULL,
+    blocked_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (project_key, blocker_id, blocked_id)
+);
+"""
+
+
+class RunJournal:
+    """Persistent map of sprint/epic/task IDs to Jira keys, per project"""
+
+    def __init__(self, path: Path):
+        """Open (or create) the journal database"""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        
+        # Journals written before content hashing lack the hash column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if 'content_hash' not in columns:
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN content_hash TEXT")
+        self._conn.commit()
+
+    @staticmethod
+    def path_for_sprints_directory(sprints_directory: str) -> Path:
+        """Journal location for a sprints directory"""
+        return Path(sprints_directory).parent / JOURNAL_FILENAME
+
+    @classmethod
+    def for_sprints_directory(cls, sprints_directory: str) -> "RunJournal":
+        """Open the journal that sits next to a sprints directory"""
+        return cls(cls.path_for_sprints_directory(sprints_directory))
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def get_epic_key(self, project_key: str, sprint_number: int, epic_name: str) -> Optional[str]:
+        """Return the Jira key of an already created epic"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jira_key FROM epics WHERE project_key = ? AND sprint_number = ? AND epic_name = ?",
+                (project_key, sprint_number, epic_name)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record_epic(self, project_key: str, sprint_number: int, epic_name: str, jira_key: str):
+        """Record an epic Jira has acknowledged"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO epics VALUES (?, ?, ?, ?, ?)",
+                (project_key, sprint_number, epic_name, jira_key, _now())
+            )
+            self._conn.commit()
+
+    def get_task_key(self, project_key: str, task_id: str) -> Optional[str]:
+        """Return the Jira key of an already created task"""
+        task = self.get_task(project_key, task_id)
+        return task[0] if task else None
+
+    def task_keys(self, project_key: str) -> Dict[str, str]:
+        """Return the Jira keys of every task created in a project, by task ID"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, jira_key FROM tasks WHERE project_key = ?", (project_key,)
+            ).fetchall()
+        return dict(rows)
+
+    def get_task(self, project_key: str, task_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the Jira key and last synced content hash of a task"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jira_key, content_hash FROM tasks WHERE project_key = ? AND task_id = ?",
+                (project_key, task_id)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record_task(self, project_key: str, task_id: str, epic_key: str, jira_key: str,
+                    content_hash: Optional[str] = None):
+        """Record a task Jira has acknowledged, with the content hash that was sent"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks (project_key, task_id, epic_key, jira_key, created_at, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (project_key, task_id, epic_key, jira_key, _now(), content_hash)
+            )
+            self._conn.commit()
+
+    def has_link(self, project_key: str, blocker_id: str, blocked_id: str) -> bool:
+        """Return whether a dependency link was already created"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM links WHERE project_key = ? AND blocker_id = ? AND blocked_id = ?",
+                (project_key, blocker_id, blocked_id)
+            ).fetchone()
+        return row is not None
+
+    def record_link(self, project_key: str, blocker_id: str, blocked_id: str):
+        """Record a dependency link Jira has acknowledged"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?)",
+                (project_key, blocker_id, blocked_id, _now())
+            )
+            self._conn.commit()
+
+
+def _now() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Project Metadata
+Discovered field IDs and create screens for a project, cached on disk
+
+Custom field IDs (Story Points, Epic Link, Epic Name) differ per Jira
+tenant. They are resolved from the field list and the project's create
+metadata, and a field is only used when it is on the issue type's create
+screen, so payloads never carry fields Jira would reject. The result is
+cached as JSON with a TTL so runs do not repeat the discovery calls.
+"""
+
+import os
+import json
+import time
+import hashlib
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Cache directory created next to the sprints directory
+METADATA_DIRNAME = ".jira_metadata"
+
+# Field names used for story points by company- and team-managed projects
+STORY_POINTS_FIELD_NAMES = ("Story Points", "Story point estimate")
+
+# Jira Software custom field types for the classic epic fields
+EPIC_LINK_FIELD_TYPE = "com.pyxis.greenhopper.jira:gh-epic-link"
+EPIC_NAME_FIELD_TYPE = "com.pyxis.greenhopper.jira:gh-epic-label"
+
+# Issue types whose create screens are read
+DISCOVERED_ISSUE_TYPES = ("Task", "Epic")
+
+# Requests of a discovery whose listings fit in one page: fields, issue types, one create screen per type
+DISCOVERY_CALLS = 2 + len(DISCOVERED_ISSUE_TYPES)
+
+
+@dataclass
+class ProjectMetadata:
+    """Field IDs resolved for one project"""
+    project_key: str
+    issue_types: Dict[str, str]
+    create_fields: Dict[str, List[str]]
+    story_points_field: Optional[str] = None
+    epic_link_field: Optional[str] = None
+    epic_name_field: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def has_field(self, issue_type: str, field_id: Optional[str]) -> bool:
+        """Whether a field can be set when creating an issue type"""
+        return field_id is not None and field_id in self.create_fields.get(issue_type, [])
+
+    def epic_parent_field(self) -> Optional[str]:
+        """Field linking a task to its epic: ``parent`` where available, else Epic Link"""
+        if self.has_field("Task", "parent"):
+            return "parent"
+        if self.has_field("Task", self.epic_link_field):
+            return self.epic_link_field
+        return None
+
+    def task_fields(self, story_points: int, epic_key: str) -> Dict:
+        """Extra create fields for a task: story points and its epic"""
+        fields = {}
+        if self.has_field("Task", self.story_points_field):
+            fields[self.story_points_field] = story_points
+        parent_field = self.epic_parent_field()
+        if epic_key and parent_field == "parent":
+            fields["parent"] = {"key": epic_key}
+        elif epic_key and parent_field:
+            fields[parent_field] = epic_key
+        return fields
+
+    def epic_fields(self, epic_name: str) -> Dict:
+        """Extra create fields for an epic: its Epic Name"""
+        if self.has_field("Epic", self.epic_name_field):
+            return {self.epic_name_field: epic_name}
+        return {}
+
+
+def discover_metadata(get_json: Callable[[str], Optional[Dict]], project_key: str,
+                      issue_types: tuple = DISCOVERED_ISSUE_TYPES) -> Optional[ProjectMetadata]:
+    """Resolve a project's field IDs with ``get_json(path)`` (None when a request fails)"""
+    fields = get_json("/rest/api/3/field")
+    types = _get_paged(get_json, f"/rest/api/3/issue/createmeta/{project_key}/issuetypes",
+                       ("issueTypes", "values"))
+    if fields is None or types is None:
+        return None
+
+    type_ids = {issue_type['name']: issue_type['id'] for issue_type in types}
+    create_fields = {}
+    for name in issue_types:
+        if name not in type_ids:
+            continue
+        screen = _get_paged(get_json, f"/rest/api/3/issue/createmeta/{project_key}/issuetypes/{type_ids[name]}",
+                            ("fields", "results", "values"))
+        create_fields[name] = [field['fieldId'] for field in screen or []]
+
+    def find(predicate, issue_type: str) -> Optional[str]:
+        """First matching field, preferring one on the issue type's create screen"""
+        matches = [field['id'] for field in fields if predicate(field)]
+        on_screen = [field_id for field_id in matches if field_id in create_fields.get(issue_type, [])]
+        return (on_screen or matches or [None])[0]
+
+    return ProjectMetadata(
+        project_key=project_key,
+        issue_types=type_ids,
+        create_fields=create_fields,
+        story_points_field=find(lambda field: field.get('name') in STORY_POINTS_FIELD_NAMES, "Task"),
+        epic_link_field=find(lambda field: field.get('schema', {}).get('custom') == EPIC_LINK_FIELD_TYPE, "Task"),
+        epic_name_field=find(lambda field: field.get('schema', {}).get('custom') == EPIC_NAME_FIELD_TYPE, "Epic"),
+        fetched_at=time.time()
+    )
+
+
+def _get_paged(get_json: Callable[[str], Optional[Dict]], path: str, keys: tuple) -> Optional[List[Dict]]:
+    """Read every page of a startAt/maxResults listing"""
+    values: List[Dict] = []
+    while True:
+        page = get_json(f"{path}?startAt={len(values)}&maxResults=200")
+        if page is None:
+            return None
+        items = next((page[key] for key in keys if key in page), [])
+        values.extend(items)
+        if not items or len(values) >= page.get('total', len(values)):
+            return values
+
+
+class MetadataCache:
+    """On-disk project metadata, one JSON entry per site and project"""
+
+    def __init__(self, cache_dir: Path, ttl: float):
+        """Initialize with the cache directory and entry lifetime in seconds"""
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @classmethod
+    def for_sprints_directory(cls, sprints_directory: str) -> "MetadataCache":
+        """Cache next to the sprints directory, unless JIRA_METADATA_DIR is set"""
+        cache_dir = os.getenv('JIRA_METADATA_DIR') or Path(sprints_directory).parent / METADATA_DIRNAME
+        return cls(Path(cache_dir), float(os.getenv('JIRA_METADATA_TTL', '86400')))
+
+    def _entry_path(self, base_url: str, project_key: str) -> Path:
+        """Cache entry path for a project"""
+        digest = hashlib.sha1(f"{base_url}|{project_key}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def load(self, base_url: str, project_key: str) -> Optional[ProjectMetadata]:
+        """Return cached metadata that has not expired"""
+        try:
+            with open(self._entry_path(base_url, project_key), 'r', encoding='utf-8') as f:
+                metadata = ProjectMetadata(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        return metadata if time.time() - metadata.fetched_at < self.ttl else None
+
+    def store(self, base_url: str, metadata: ProjectMetadata):
+        """Write metadata for a project"""
+        entry_path = self._entry_path(base_url, metadata.project_key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(metadata), f, indent=2)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # The cache is an optimization; the metadata is still used
+            pass
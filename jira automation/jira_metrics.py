@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Run Metrics
+Thread-safe counters, request latency and phase timings for a run
+
+Collects run counters (epics/tasks created, failed, skipped...),
+per-endpoint request latencies with p50/p95/p99, retries, circuit
+breaker trips, throttled (429) responses, bytes on the wire and per-phase durations, and exports
+them as JSON and as a Prometheus text-format snapshot.
+"""
+
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Run counters reported by the automation
+RUN_COUNTERS = (
+    'sprints_processed',
+    'epics_created',
+    'epics_failed',
+    'tasks_created',
+    'tasks_failed',
+    'epics_skipped',
+    'tasks_skipped',
+    'tasks_updated',
+    'links_created',
+    'links_failed',
+    'links_skipped',
+    'links_unresolved',
+    'request_retries',
+    'breaker_trips',
+)
+
+# Issue and project keys in request paths collapse into one endpoint label
+_KEY_SEGMENT = re.compile(r'/[A-Z][A-Z0-9_]*(?:-\d+)?(?=/|$)')
+
+METRICS_JSON_FILENAME = "jira_run_metrics.json"
+METRICS_PROM_FILENAME = "jira_run_metrics.prom"
+
+
+def endpoint_label(method: str, path: str) -> str:
+    """Endpoint label for a request, e.g. 'PUT /rest/api/3/issue/{key}'"""
+    return f"{method} {_KEY_SEGMENT.sub('/{key}', path)}"
+
+
+def _percentile(sorted_samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(percent / 100.0 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class RunMetrics:
+    """Metrics for one automation run, safe to update from concurrent workers"""
+
+    def __init__(self):
+        """Initialize empty metrics"""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {name: 0 for name in RUN_COUNTERS}
+        self._latencies: Dict[str, List[float]] = {}
+        self._responses: Dict[str, Dict[int, int]] = {}
+        self._retries: Dict[str, int] = {}
+        self._throttled: Dict[str, int] = {}
+        self._phases: Dict[str, float] = {}
+        self._open_phases: Dict[str, List] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.started_at = time.time()
+
+    def increment(self, name: str, amount: int = 1):
+        """Increase a run counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def counters(self) -> Dict[str, int]:
+        """Copy of the run counters"""
+        with self._lock:
+            return dict(self._counters)
+
+    def observe_request(self, endpoint: str, seconds: float, status_code: int,
+                        bytes_sent: int, bytes_received: int):
+        """Record one HTTP request"""
+        with self._lock:
+            self._latencies.setdefault(endpoint, []).append(seconds)
+            statuses = self._responses.setdefault(endpoint, {})
+            statuses[status_code] = statuses.get(status_code, 0) + 1
+            if status_code == 429:
+                self._throttled[endpoint] = self._throttled.get(endpoint, 0) + 1
+            self.bytes_sent += bytes_sent
+            self.bytes_received += bytes_received
+
+    def record_retry(self, endpoint: str):
+        """Record that a request to an endpoint is being retried"""
+        with self._lock:
+            self._retries[endpoint] = self._retries.get(endpoint, 0) + 1
+            self._counters['request_retries'] += 1
+
+    def add_phase_time(self, phase: str, seconds: float):
+        """Add wall-clock time to a run phase"""
+        with self._lock:
+            self._phases[phase] = self._phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str):
+        """Time a block as part of a run phase (parse, preflight, epic_creation, ...).
+
+        Blocks of the same phase may run concurrently (one per epic); the
+        phase is charged the wall-clock time during which at least one of
+        them was running, not the sum of their durations.
+        """
+        with self._lock:
+            open_phase = self._open_phases.setdefault(phase, [0, 0.0])
+            if open_phase[0] == 0:
+                open_phase[1] = time.perf_counter()
+            open_phase[0] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                open_phase[0] -= 1
+                if open_phase[0] == 0:
+                    self._phases[phase] = self._phases.get(phase, 0.0) + time.perf_counter() - open_phase[1]
+
+    def snapshot(self) -> Dict:
+        """All metrics as plain data"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, samples in self._latencies.items():
+                ordered = sorted(samples)
+                endpoints[endpoint] = {
+                    'requests': len(ordered),
+                    'latency_seconds': {
+                        'p50': _percentile(ordered, 50),
+                        'p95': _percentile(ordered, 95),
+                        'p99': _percentile(ordered, 99),
+                        'max': ordered[-1],
+                        'sum': sum(ordered),
+                    },
+                    'responses': {str(status): count for status, count in sorted(self._responses[endpoint].items())},
+                    'retries': self._retries.get(endpoint, 0),
+                    'throttled': self._throttled.get(endpoint, 0),
+                }
+            return {
+                'counters': dict(self._counters),
+                'endpoints': endpoints,
+                'retries': sum(self._retries.values()),
+                'throttled': sum(self._throttled.values()),
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+                'phases_seconds': dict(self._phases),
+                'run_seconds': time.time() - self.started_at,
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text-format snapshot"""
+        data = self.snapshot()
+        lines = []
+
+        for name, value in data['counters'].items():
+            lines.append(f"# TYPE eaio_jira_{name}_total counter")
+            lines.append(f"eaio_jira_{name}_total {value}")
+
+        lines.append("# HELP eaio_jira_request_duration_seconds Jira request latency by endpoint")
+        lines.append("# TYPE eaio_jira_request_duration_seconds summary")
+        for endpoint, stats in data['endpoints'].items():
+            label = f'endpoint="{endpoint}"'
+            latency = stats['latency_seconds']
+            for quantile, key in (("0.5", 'p50'), ("0.95", 'p95'), ("0.99", 'p99')):
+                lines.append(f'eaio_jira_request_duration_seconds{{{label},quantile="{quantile}"}} {latency[key]:.6f}')
+            lines.append(f"eaio_jira_request_duration_seconds_sum{{{label}}} {latency['sum']:.6f}")
+            lines.append(f"eaio_jira_request_duration_seconds_count{{{label}}} {stats['requests']}")
+
+        lines.append("# TYPE eaio_jira_responses_total counter")
+        for endpoint, stats in data['endpoints'].items():
+            for status, count in stats['responses'].items():
+                lines.append(f'eaio_jira_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+        for name in ('retries', 'throttled'):
+            lines.append(f"# TYPE eaio_jira_{name}_total counter")
+            for endpoint, stats in data['endpoints'].items():
+                lines.append(f'eaio_jira_{name}_total{{endpoint="{endpoint}"}} {stats[name]}')
+
+        lines.append("# TYPE eaio_jira_bytes_sent_total counter")
+        lines.append(f"eaio_jira_bytes_sent_total {data['bytes_sent']}")
+        lines.append("# TYPE eaio_jira_bytes_received_total counter")
+        lines.append(f"eaio_jira_bytes_received_total {data['bytes_received']}")
+
+        lines.append("# TYPE eaio_jira_phase_duration_seconds gauge")
+        for phase, seconds in data['phases_seconds'].items():
+            lines.append(f'eaio_jira_phase_duration_seconds{{phase="{phase}"}} {seconds:.6f}')
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path, label: Optional[str] = None) -> Path:
+        """Write the JSON and Prometheus snapshots into a directory, returning the JSON path.
+
+        A label (e.g. a project key) is appended to the file names.
+        """
+        directory = Path(directory)
+        suffix = f"_{label}" if label else ""
+        json_path = directory / METRICS_JSON_FILENAME.replace(".json", f"{suffix}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        with open(directory / METRICS_PROM_FILENAME.replace(".prom", f"{suffix}.prom"), 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        return json_path
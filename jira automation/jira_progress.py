@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Run Progress
+Live progress view of issue creation with a moving-average rate and ETA
+
+Totals come from the parsed plan. Completed and failed counts are read
+from the run metrics when the view is redrawn, so creation workers only
+bump an in-flight gauge and never wait on rendering; redraws happen on
+rich's refresh thread at most ``refresh_per_second`` times a second.
+"""
+
+import os
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+from jira_metrics import RunMetrics
+
+# Counters of issues that are done (created, already in Jira or updated)
+DONE_COUNTERS = ('epics_created', 'epics_skipped', 'tasks_created', 'tasks_skipped', 'tasks_updated')
+
+# Counters of issues that could not be created
+FAILED_COUNTERS = ('epics_failed', 'tasks_failed')
+
+
+class RateWindow:
+    """Moving-average rate of a growing count over the last ``window`` seconds"""
+
+    def __init__(self, window: float = 30.0):
+        """Initialize with the averaging window in seconds"""
+        self.window = window
+        self._samples = deque()
+
+    def add(self, count: int, now: Optional[float] = None) -> float:
+        """Record the current count and return the rate per second"""
+        now = time.monotonic() if now is None else now
+        self._samples.append((now, count))
+        while len(self._samples) > 2 and now - self._samples[1][0] >= self.window:
+            self._samples.popleft()
+        first_time, first_count = self._samples[0]
+        return (count - first_count) / (now - first_time) if now > first_time else 0.0
+
+
+class _MetricsProgress(Progress):
+    """Progress that refreshes its task from the run metrics just before each redraw"""
+
+    def __init__(self, run_progress: "RunProgress", *columns, **kwargs):
+        self.run_progress = run_progress
+        super().__init__(*columns, **kwargs)
+
+    def get_renderables(self):
+        self.run_progress.sync()
+        yield from super().get_renderables()
+
+
+class RunProgress:
+    """Live view of a run: total, completed, failed and in-flight issues, rate and ETA"""
+
+    def __init__(self, metrics: Iterable[RunMetrics], console: Optional[Console] = None,
+                 refresh_per_second: Optional[float] = None, window: float = 30.0):
+        """Initialize with the metrics of the automations being watched"""
+        self.metrics = list(metrics)
+        self.total = 0
+        self.in_flight = 0
+        self._rate = RateWindow(window)
+        self._task_id = None
+        if refresh_per_second is None:
+            refresh_per_second = float(os.getenv('JIRA_PROGRESS_REFRESH', '4'))
+        self._progress = _MetricsProgress(
+            self,
+            TextColumn("[bold]Issues"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[status]}"),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=refresh_per_second,
+        )
+        self._task_id = self._progress.add_task("issues", total=0, status="")
+
+    def add(self, issues: int):
+        """Add issues to the expected total (plans streamed from the parser grow as they are read)"""
+        self.total += issues
+
+    def sync(self):
+        """Copy the latest counts into the view; called by the refresh thread"""
+        if self._task_id is None:
+            return
+        counters = {}
+        for metrics in self.metrics:
+            for name, value in metrics.counters().items():
+                counters[name] = counters.get(name, 0) + value
+        done = sum(counters.get(name, 0) for name in DONE_COUNTERS)
+        failed = sum(counters.get(name, 0) for name in FAILED_COUNTERS)
+        finished = done + failed
+        rate = self._rate.add(finished)
+        remaining = max(0, self.total - finished)
+
+        status = f"❌ {failed} failed · ⏳ {self.in_flight} in flight · {rate:.1f} issues/s"
+        if rate > 0 and remaining:
+            status += f" · ETA {_format_seconds(remaining / rate)}"
+        self._progress.update(self._task_id, total=max(self.total, finished), completed=finished, status=status)
+
+    def __enter__(self) -> "RunProgress":
+        self._progress.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._progress.refresh()
+        self._progress.stop()
+
+
+def _format_seconds(seconds: float) -> str:
+    """Duration as H:MM:SS or M:SS"""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Rate Limiter
+Adaptive token bucket shared by every Jira API call
+
+Starts from the configured request rate, halves it whenever Jira answers
+429/503, honors Retry-After and X-RateLimit-* headers, and adds back a
+fixed step for every healthy response (AIMD).
+"""
+
+import time
+import asyncio
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+# Responses that mean Jira is throttling or overloaded
+THROTTLE_STATUSES = (429, 503)
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD token bucket usable from sync and async code"""
+
+    def __init__(self, rate: float = 2.0, min_rate: float = 0.2, max_rate: float = 20.0,
+                 increase_step: float = 0.25, backoff_factor: float = 0.5, burst: float = 1.0):
+        """Initialize with the starting rate in requests per second"""
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.increase_step = increase_step
+        self.backoff_factor = backoff_factor
+        self.burst = burst
+        self.throttled_responses = 0
+
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay: float, **kwargs) -> "AdaptiveRateLimiter":
+        """Create a limiter starting at one request per ``delay`` seconds"""
+        max_rate = kwargs.get('max_rate', 20.0)
+        return cls(rate=1.0 / delay if delay > 0 else max_rate, **kwargs)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+
+            # Tokens may go negative: each waiter reserves its own slot
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, status_code: int, headers: Mapping[str, str]):
+        """Adapt the rate to a Jira response"""
+        with self._lock:
+            now = time.monotonic()
+            pause = self._pause_from_headers(status_code, headers)
+            if pause is not None:
+                self._blocked_until = max(self._blocked_until, now + pause)
+
+            if status_code in THROTTLE_STATUSES:
+                self.throttled_responses += 1
+                self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+                self._tokens = min(self._tokens, 0.0)
+            elif status_code < 400 and headers.get('X-RateLimit-NearLimit', '').lower() != 'true':
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def _pause_from_headers(self, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds Jira asked us to wait, if any"""
+        retry_after = headers.get('Retry-After')
+        if retry_after and status_code in THROTTLE_STATUSES:
+            return _parse_retry_after(retry_after)
+
+        # An exhausted quota blocks until the window resets
+        if headers.get('X-RateLimit-Remaining') == '0':
+            reset = headers.get('X-RateLimit-Reset')
+            if reset:
+                return _seconds_until(reset)
+        return None
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After value given in seconds or as an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _seconds_until(timestamp: str) -> Optional[float]:
+    """Seconds until an ISO 8601 timestamp such as X-RateLimit-Reset"""
+    try:
+        reset_at = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+EAIO Jira Retry Policy
+Backoff for transient failures and a circuit breaker for a degraded Jira
+
+Transient server errors and connection failures are retried with
+exponential backoff and full jitter, up to a maximum number of attempts.
+Issue creation is not idempotent, so a POST is only retried when the
+connection to Jira was never established. Any 5xx answer, even from a
+gateway, may come after Jira received and processed the request.
+A circuit breaker shared by all workers pauses every request for a
+cooldown when the recent error rate crosses a threshold.
+"""
+
+import os
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from typing import Optional
+
+import aiohttp
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# Server errors worth retrying; 429 and 503 are retried by the rate limiter
+RETRY_STATUSES = (500, 502, 504)
+
+# Throttling answers that mean the request was rejected unprocessed
+REJECTED_STATUSES = (429,)
+
+# Methods that can be repeated without side effects
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE', 'HEAD')
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient request failures"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 timeout: float = 30.0):
+        """Initialize with the total attempts per request, backoff bounds and request timeout"""
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Policy configured by JIRA_RETRY_* and JIRA_REQUEST_TIMEOUT"""
+        return cls(
+            max_attempts=int(os.getenv('JIRA_RETRY_MAX_ATTEMPTS', '4')),
+            base_delay=float(os.getenv('JIRA_RETRY_BASE_DELAY', '0.5')),
+            max_delay=float(os.getenv('JIRA_RETRY_MAX_DELAY', '30')),
+            timeout=float(os.getenv('JIRA_REQUEST_TIMEOUT', '30'))
+        )
+
+    def should_retry(self, method: str, attempt: int, status_code: Optional[int] = None,
+                     error: Optional[BaseException] = None) -> bool:
+        """Whether a request that failed on its ``attempt``-th try may be sent again"""
+        if attempt >= self.max_attempts:
+            return False
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if status_code is not None:
+            return idempotent and status_code in RETRY_STATUSES
+        return idempotent or _never_connected(error)
+
+    def resend_throttled(self, method: str, status_code: int) -> bool:
+        """Whether a throttled (429/503) request may be resent once the rate limiter allows.
+
+        A 429 rejects the request, so any method is resent; a 503 may come
+        after Jira created the issue, so only idempotent methods are.
+        """
+        return status_code in REJECTED_STATUSES or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Pauses all requests when too many of the recent ones failed"""
+
+    def __init__(self, window: int = 20, error_rate: float = 0.5, cooldown: float = 30.0):
+        """Initialize with the number of outcomes considered, the tripping error rate and the pause"""
+        self.window = window
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self.trips = 0
+
+        self._outcomes = deque(maxlen=window)
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        """Breaker configured by JIRA_BREAKER_*"""
+        return cls(
+            window=int(os.getenv('JIRA_BREAKER_WINDOW', '20')),
+            error_rate=float(os.getenv('JIRA_BREAKER_ERROR_RATE', '0.5')),
+            cooldown=float(os.getenv('JIRA_BREAKER_COOLDOWN', '30'))
+        )
+
+    def record(self, success: bool) -> bool:
+        """Record a request outcome; returns True if this outcome tripped the breaker"""
+        with self._lock:
+            self._outcomes.append(success)
+            if len(self._outcomes) < self.window:
+                return False
+            errors = self._outcomes.count(False)
+            if errors / len(self._outcomes) < self.error_rate:
+                return False
+
+            # Start over after the pause so a recovered Jira is judged afresh
+            self._open_until = time.monotonic() + self.cooldown
+            self._outcomes.clear()
+            self.trips += 1
+            return True
+
+    def pause_seconds(self) -> float:
+        """Seconds left before requests may be sent again"""
+        return max(0.0, self._open_until - time.monotonic())
+
+    def wait(self):
+        """Block while the breaker is open"""
+        pause = self.pause_seconds()
+        if pause > 0:
+            time.sleep(pause)
+
+    async def wait_async(self):
+        """Wait without blocking the event loop while the breaker is open"""
+        pause = self.pause_seconds()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+
+def _never_connected(error: Optional[BaseException]) -> bool:
+    """Whether a request failed before a connection to Jira was established"""
+    if isinstance(error, (requests.exceptions.ConnectTimeout, aiohttp.ClientConnectorError)):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    return False
@@ -13,7 +13,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.text import Text
-from eaio_jira_automation import EAIOJiraAutomation
+from eaio_jira_automation import EAIOJiraAutomation, ThreadedJiraAPI
 
 # Load environment variables
 load_dotenv()
@@ -43,7 +43,44 @@ def display_sprint_preview(sprint, sprint_file):
     total_tasks = sum(len(epic.tasks) for epic in sprint.epics)
     console.print(f"\n📝 [bold]Total: {len(sprint.epics)} epics, {total_tasks} tasks[/bold]")
 
-def customize_epic(epic, epic_index):
+def choose_task(epic, question, task_index=None):
+    """Ask for one of an epic's tasks by list number or task ID"""
+    choices = [str(i+1) for i in range(len(epic.tasks))] + [task.id for task in epic.tasks]
+    answer = Prompt.ask(f"{question} (number or ID)", choices=choices, show_choices=False)
+    if answer.isdigit():
+        return epic.tasks[int(answer) - 1]
+    entry = task_index.get(answer) if task_index is not None else None
+    if entry is not None and entry.epic is epic:
+        return entry.task
+    return next(task for task in epic.tasks if task.id == answer)
+
+def lookup_tasks(task_index):
+    """Look tasks up by ID, assignee or priority"""
+    console.print("\n🔎 [bold]Task lookup[/bold]: enter a task ID, assignee=<role> or priority=<level> (empty to finish)")
+    while True:
+        query = Prompt.ask("Lookup", default="")
+        if not query.strip():
+            return
+        
+        entries = task_index.select([query])
+        if not entries:
+            console.print(f"❌ No tasks match '{query}'")
+            continue
+        
+        table = Table(title=f"🔎 {len(entries)} task(s) for '{query}'")
+        table.add_column("Task", style="cyan")
+        table.add_column("Title", style="white")
+        table.add_column("Sprint", style="magenta")
+        table.add_column("Epic", style="green")
+        table.add_column("Source", style="dim")
+        table.add_column("Assignee", style="yellow")
+        table.add_column("Jira", style="blue")
+        for entry in entries:
+            table.add_row(entry.task.id, entry.task.title, str(entry.sprint_number), entry.epic.name,
+                          entry.location, entry.task.assignee, entry.jira_key or "-")
+        console.print(table)
+
+def customize_epic(epic, epic_index, task_index=None):
     """Allow user to customize an epic"""
     console.print(f"\n🔧 [bold yellow]Customizing Epic {epic_index + 1}: {epic.name}[/bold yellow]")
     
@@ -75,19 +112,14 @@ def customize_epic(epic, epic_index):
             break
         elif action == "remove":
             if len(epic.tasks) > 0:
-                task_num = IntPrompt.ask(
-                    "Remove which task number?", 
-                    choices=[str(i+1) for i in range(len(epic.tasks))]
-                )
-                removed_task = epic.tasks.pop(task_num - 1)
+                removed_task = choose_task(epic, "Remove which task?", task_index)
+                epic.tasks.remove(removed_task)
+                if task_index is not None:
+                    task_index.remove(removed_task.id)
                 console.print(f"✅ Removed: {removed_task.title}")
         elif action == "modify":
             if len(epic.tasks) > 0:
-                task_num = IntPrompt.ask(
-                    "Modify which task number?", 
-                    choices=[str(i+1) for i in range(len(epic.tasks))]
-                )
-                task = epic.tasks[task_num - 1]
+                task = choose_task(epic, "Modify which task?", task_index)
                 
                 if Confirm.ask(f"Modify task title '{task.title}'?", default=False):
                     new_title = Prompt.ask("Enter new task title", default=task.title)
@@ -103,7 +135,7 @@ def customize_epic(epic, epic_index):
     
     return epic
 
-def customize_sprint(sprint, sprint_file):
+def customize_sprint(sprint, sprint_file, task_index=None):
     """Allow user to customize sprint epics and tasks"""
     console.print(f"\n🎨 [bold green]Customizing Sprint {sprint.number}[/bold green]")
     
@@ -142,14 +174,17 @@ def customize_sprint(sprint, sprint_file):
                 if epic_num == 0:
                     for i, epic in enumerate(sprint.epics):
                         if Confirm.ask(f"Customize epic {i+1}: {epic.name}?", default=False):
-                            sprint.epics[i] = customize_epic(epic, i)
+                            sprint.epics[i] = customize_epic(epic, i, task_index)
                 else:
-                    sprint.epics[epic_num - 1] = customize_epic(sprint.epics[epic_num - 1], epic_num - 1)
+                    sprint.epics[epic_num - 1] = customize_epic(sprint.epics[epic_num - 1], epic_num - 1, task_index)
         elif action == "remove":
             if len(sprint.epics) > 0:
                 epic_choices = [f"{i+1}" for i in range(len(sprint.epics))]
                 epic_num = IntPrompt.ask("Remove which epic?", choices=epic_choices)
                 removed_epic = sprint.epics.pop(epic_num - 1)
+                if task_index is not None:
+                    for task in removed_epic.tasks:
+                        task_index.remove(task.id)
                 console.print(f"✅ Removed epic: {removed_epic.name}")
         elif action == "reorder":
             console.print("📝 Current epic order:")
@@ -269,10 +304,14 @@ def validate_creation_results(automation: EAIOJiraAutomation) -> dict:
     """Validate the results of task and epic creation"""
     stats = automation.stats
     
+    # Items found in the run journal were created by an earlier run
+    epics_done = stats['epics_created'] + stats.get('epics_skipped', 0)
+    tasks_done = stats['tasks_created'] + stats.get('tasks_skipped', 0) + stats.get('tasks_updated', 0)
+    
     validation_results = {
         'total_sprints': stats['sprints_processed'],
-        'total_epics_attempted': stats['epics_created'] + stats.get('epics_failed', 0),
-        'total_tasks_attempted': stats['tasks_created'] + stats['tasks_failed'],
+        'total_epics_attempted': epics_done + stats.get('epics_failed', 0),
+        'total_tasks_attempted': tasks_done + stats['tasks_failed'],
         'epics_success_rate': 0,
         'tasks_success_rate': 0,
         'status': 'UNKNOWN'
@@ -280,13 +319,13 @@ def validate_creation_results(automation: EAIOJiraAutomation) -> dict:
     
     # Calculate success rates
     if validation_results['total_epics_attempted'] > 0:
-        validation_results['epics_success_rate'] = (stats['epics_created'] / validation_results['total_epics_attempted']) * 100
+        validation_results['epics_success_rate'] = (epics_done / validation_results['total_epics_attempted']) * 100
     
     if validation_results['total_tasks_attempted'] > 0:
-        validation_results['tasks_success_rate'] = (stats['tasks_created'] / validation_results['total_tasks_attempted']) * 100
+        validation_results['tasks_success_rate'] = (tasks_done / validation_results['total_tasks_attempted']) * 100
     
     # Determine overall status
-    if stats['tasks_created'] == 0:
+    if tasks_done == 0:
         validation_results['status'] = 'FAILED'
     elif stats['tasks_failed'] == 0:
         validation_results['status'] = 'SUCCESS'
@@ -325,6 +364,26 @@ def create_validation_report(validation_results: dict, automation: EAIOJiraAutom
     table.add_row("Tasks Created", f"{stats['tasks_created']}/{validation_results['total_tasks_attempted']}", 
                  f"{validation_results['tasks_success_rate']:.1f}%")
     table.add_row("Tasks Failed", str(stats['tasks_failed']), "❌" if stats['tasks_failed'] > 0 else "✅")
+    if stats.get('epics_skipped', 0) or stats.get('tasks_skipped', 0):
+        table.add_row("Already in Jira (journal)", f"{stats['epics_skipped']} epics, {stats['tasks_skipped']} tasks", "⏭️")
+    if stats.get('tasks_updated', 0):
+        table.add_row("Tasks Updated (sync)", str(stats['tasks_updated']), "🔄")
+    links_attempted = stats.get('links_created', 0) + stats.get('links_failed', 0) + stats.get('links_unresolved', 0)
+    if links_attempted or stats.get('links_skipped', 0):
+        table.add_row("Dependency Links", f"{stats['links_created']}/{links_attempted} "
+                      f"({stats['links_unresolved']} waiting for tasks, {stats['links_skipped']} already linked)",
+                      "❌" if stats['links_failed'] > 0 else "🔗")
+    request_metrics = automation.metrics.snapshot()
+    requests_sent = sum(endpoint['requests'] for endpoint in request_metrics['endpoints'].values())
+    if requests_sent:
+        table.add_row("HTTP Requests", f"{requests_sent} ({request_metrics['retries']} retries, "
+                      f"{request_metrics['throttled']} throttled)", "🌐")
+        if stats.get('breaker_trips', 0):
+            table.add_row("Circuit Breaker Trips", str(stats['breaker_trips']), "⛔")
+        for endpoint, endpoint_metrics in request_metrics['endpoints'].items():
+            latency = endpoint_metrics['latency_seconds']
+            table.add_row(f"  {endpoint}", f"p50 {latency['p50'] * 1000:.0f}ms, p95 {latency['p95'] * 1000:.0f}ms, "
+                          f"p99 {latency['p99'] * 1000:.0f}ms", "⏱️")
     table.add_row("Overall Status", validation_results['status'], 
                  f"[{status_colors[validation_results['status']]}]{validation_results['status']}[/]")
     
@@ -447,6 +506,7 @@ async def main():
     console.print(f"   Sprints Dir: {sprints_dir}")
     
     # Initialize automation
+    automation = None
     try:
         automation = EAIOJiraAutomation(
             jira_url=str(jira_url),
@@ -455,9 +515,16 @@ async def main():
             project_key=project_key
         )
         
+        if isinstance(automation.jira_client, ThreadedJiraAPI):
+            console.print(f"   Client: thread pool ({automation.max_concurrency} worker threads)")
+        elif automation.max_concurrency > 1:
+            console.print(f"   Client: async ({automation.max_concurrency} requests in flight)")
+        
         # Test connection first
         console.print("\n🔍 Testing Jira connection...")
-        if not automation.jira_client.test_connection():
+        with automation.metrics.phase('preflight'):
+            connected = automation.jira_client.test_connection()
+        if not connected:
             console.print("❌ Failed to connect to Jira. Check your credentials.", style="red")
             return 1
         
@@ -470,20 +537,29 @@ async def main():
         # Parse all sprint files first
         console.print("\n📋 Parsing sprint files...")
         sprints_path = automation._get_sprints_path(sprints_dir)
+        automation.open_journal(sprints_dir)
+        automation.load_project_metadata(sprints_dir)
         sprint_files = sorted([f for f in sprints_path.glob("sprint_*.md")])
         
         sprints_data = []
-        for sprint_file in sprint_files:
-            try:
-                sprint = automation.parse_sprint_file(sprint_file)
+        with automation.metrics.phase('parse'):
+            parsed_sprints = automation.parse_sprint_files(sprint_files)
+        for sprint_file, sprint in parsed_sprints:
+            if isinstance(sprint, Exception):
+                console.print(f"  ❌ Failed to parse {sprint_file.name}: {sprint}")
+            else:
                 sprints_data.append((sprint, sprint_file.name))
                 console.print(f"  ✅ Parsed: {sprint_file.name} ({len(sprint.epics)} epics)")
-            except Exception as e:
-                console.print(f"  ❌ Failed to parse {sprint_file.name}: {e}")
         
         if not sprints_data:
             console.print("❌ No valid sprint files found", style="red")
             return 1
+        automation.preflight_existing_issues(sprint.number for sprint, _ in sprints_data)
+        
+        # One index over all sprints for lookups, customization and dependency checks
+        task_index = automation.build_task_index([(sprint, sprints_path / sprint_file) for sprint, sprint_file in sprints_data])
+        if Confirm.ask(f"\n🔎 Look up tasks ({len(task_index)} indexed) by ID, assignee or priority?", default=False):
+            lookup_tasks(task_index)
         
         # Interactive sprint selection
         selected_indices = interactive_sprint_selection(sprints_data)
@@ -498,7 +574,7 @@ async def main():
                 
                 # Ask if user wants to customize this sprint
                 if Confirm.ask(f"\nCustomize Sprint {sprint.number}?", default=False):
-                    sprints_data[index] = (customize_sprint(sprint, sprint_file), sprint_file)
+                    sprints_data[index] = (customize_sprint(sprint, sprint_file, task_index), sprint_file)
         
         # Create creation summary
         summary = create_creation_summary(sprints_data, selected_indices)
@@ -510,14 +586,16 @@ async def main():
         
         # Run automation for selected sprints
         console.print("\n🚀 Starting automation...")
-        for index in selected_indices:
-            sprint, sprint_file = sprints_data[index]
-            
-            console.print(f"\n📋 Processing: Sprint {sprint.number}")
-            
-            # Process this sprint
-            await automation.process_single_sprint(sprint)
-            automation.stats['sprints_processed'] += 1
+        selected_sprints = [sprints_data[index][0] for index in selected_indices]
+        console.print(f"\n📋 Processing: Sprints {', '.join(str(sprint.number) for sprint in selected_sprints)}")
+        
+        # All epics are created concurrently, each releasing its own tasks
+        for sprint in await automation.process_sprints(selected_sprints):
+            automation.metrics.increment('sprints_processed')
+        
+        # Dependencies may point into sprints created by earlier runs
+        if automation.link_dependencies:
+            await automation.create_dependency_links([sprint for sprint, _ in sprints_data])
         
         # Validate results
         console.print("\n🔍 Validating creation results...")
@@ -526,6 +604,7 @@ async def main():
         # Create detailed validation report
         console.print("\n" + "=" * 60)
         create_validation_report(validation_results, automation)
+        automation.write_metrics(sprints_dir)
         
         # Create summary dashboard if tasks were created
         if automation.stats['tasks_created'] > 0:
@@ -549,6 +628,9 @@ async def main():
         import traceback
         console.print(f"🔍 Error details: {traceback.format_exc()}", style="dim")
         return 1
+    finally:
+        if automation is not None:
+            await automation.close()
 
 if __name__ == "__main__":
     exit(asyncio.run(main())) 
\ No newline at end of file
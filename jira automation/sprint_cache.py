@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+EAIO Sprint Parse Cache
+On-disk cache of parsed sprint files
+
+Entries are keyed by the sprint file's path and validated against its
+mtime/size (no read needed) and, when those changed, against a hash of
+its content. Parsed sprints are stored as compact JSON so unchanged
+files skip the markdown parser entirely.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+# Cache directory created inside the sprints directory
+CACHE_DIRNAME = ".sprint_cache"
+
+
+class SprintCache:
+    """Parsed-sprint cache stored as one JSON entry per sprint file"""
+
+    def __init__(self, cache_dir: Path, version: str):
+        """Initialize with the cache directory and the parser version entries must match"""
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+
+    @classmethod
+    def for_sprint_file(cls, file_path: Path, version: str) -> "SprintCache":
+        """Cache living in the sprint file's directory, unless SPRINT_CACHE_DIR is set"""
+        cache_dir = os.getenv('SPRINT_CACHE_DIR') or Path(file_path).parent / CACHE_DIRNAME
+        return cls(Path(cache_dir), version)
+
+    def _entry_path(self, file_path: Path) -> Path:
+        """Cache entry path for a sprint file"""
+        digest = hashlib.sha1(str(Path(file_path).resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_entry(self, file_path: Path) -> Optional[Dict]:
+        """Read a cache entry written by this parser version"""
+        try:
+            with open(self._entry_path(file_path), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('version') == self.version else None
+
+    def load_unchanged(self, file_path: Path) -> Optional[Dict]:
+        """Return cached sprint data if the file's mtime and size are unchanged"""
+        entry = self._read_entry(file_path)
+        if entry is None:
+            return None
+        stat = os.stat(file_path)
+        if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['sprint']
+        return None
+
+    def load_matching(self, file_path: Path, content: str) -> Optional[Dict]:
+        """Return cached sprint data if the file content is unchanged (e.g. only touched)"""
+        entry = self._read_entry(file_path)
+        if entry is None or entry['content_hash'] != _content_hash(content):
+            return None
+        self.store(file_path, content, entry['sprint'])
+        return entry['sprint']
+
+    def store(self, file_path: Path, content: str, sprint_data: Dict):
+        """Write the parsed sprint data for a file"""
+        stat = os.stat(file_path)
+        entry = {
+            'version': self.version,
+            'path': str(file_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'content_hash': _content_hash(content),
+            'sprint': sprint_data
+        }
+        entry_path = self._entry_path(file_path)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # The cache is an optimization; parsing still succeeded
+            pass
+
+
+def _content_hash(content: str) -> str:
+    """Hash of a sprint file's content"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+EAIO Sprint File Watcher
+Reports which sprint files changed, debounced
+
+Uses inotify (through the optional ``watchdog`` package) when available
+and falls back to polling file sizes and modification times. Changes are
+collected until the directory has been quiet for ``debounce`` seconds, so
+an editor's burst of writes, or a checkout touching many files, arrives
+as one batch.
+"""
+
+import os
+import asyncio
+import fnmatch
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # polling fallback
+    FileSystemEventHandler = object
+    Observer = None
+
+SPRINT_FILE_PATTERN = "sprint_*.md"
+
+
+class SprintWatcher:
+    """Watches a sprints directory and yields batches of changed sprint files"""
+
+    def __init__(self, directory: Path, debounce: Optional[float] = None,
+                 poll_interval: Optional[float] = None, use_inotify: bool = True):
+        """Initialize with the directory, quiet period and polling interval (seconds)"""
+        self.directory = Path(directory)
+        self.debounce = float(os.getenv('JIRA_WATCH_DEBOUNCE', '2')) if debounce is None else debounce
+        self.poll_interval = float(os.getenv('JIRA_WATCH_POLL', '1')) if poll_interval is None else poll_interval
+        self.use_inotify = use_inotify and Observer is not None
+        self._changed: Set[Path] = set()
+        self._event: Optional[asyncio.Event] = None
+
+    @property
+    def backend(self) -> str:
+        """'inotify' or 'polling'"""
+        return "inotify" if self.use_inotify else "polling"
+
+    def _signatures(self) -> Dict[Path, Tuple[int, int]]:
+        """Size and modification time of every sprint file"""
+        signatures = {}
+        for path in self.directory.glob(SPRINT_FILE_PATTERN):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signatures[path] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def _notify(self, path: Path):
+        """Record a changed file (called on the event loop)"""
+        self._changed.add(path)
+        self._event.set()
+
+    async def _poll(self):
+        """Detect new and modified files by comparing stat signatures"""
+        known = self._signatures()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = self._signatures()
+            for path, signature in current.items():
+                if known.get(path) != signature:
+                    self._notify(path)
+            known = current
+
+    async def changes(self) -> AsyncIterator[List[Path]]:
+        """Yield sorted batches of changed sprint files, forever"""
+        loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        observer = poller = None
+        if self.use_inotify:
+            observer = Observer()
+            observer.schedule(_SprintFileHandler(loop, self._notify), str(self.directory), recursive=False)
+            observer.start()
+        else:
+            poller = asyncio.ensure_future(self._poll())
+
+        try:
+            while True:
+                await self._event.wait()
+                # Debounce: wait until no change arrived for a full quiet period
+                while True:
+                    self._event.clear()
+                    try:
+                        await asyncio.wait_for(self._event.wait(), timeout=self.debounce)
+                    except asyncio.TimeoutError:
+                        break
+                batch, self._changed = sorted(self._changed), set()
+                self._event.clear()
+                batch = [path for path in batch if path.exists()]
+                if batch:
+                    yield batch
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            if poller is not None:
+                poller.cancel()
+
+
+class _SprintFileHandler(FileSystemEventHandler):
+    """Forwards sprint file events from the watchdog thread to the event loop"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, notify):
+        super().__init__()
+        self.loop = loop
+        self.notify = notify
+
+    def _forward(self, path: str):
+        if fnmatch.fnmatch(os.path.basename(path), SPRINT_FILE_PATTERN):
+            self.loop.call_soon_threadsafe(self.notify, Path(path))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_moved(self, event):
+        # Editors that save through a temporary file rename it over the sprint file
+        if not event.is_directory:
+            self._forward(event.dest_path)
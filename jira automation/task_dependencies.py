@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+EAIO Task Dependency Graph
+Dependency graph over the tasks of all parsed sprints
+
+Built from each task's ``**Dependencies**`` list. Reports dependencies on
+task IDs that do not exist in the plan and dependency cycles, and groups
+the remaining "blocks" edges into topological waves: every edge in a wave
+starts at a task whose own blockers were all linked in earlier waves.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+# Task IDs inside free-form dependency text ("T3.001 (schema)", "T1.2")
+TASK_ID_PATTERN = re.compile(r'T\d+\.\d+')
+
+
+class DependencyGraph:
+    """Directed graph of blocker -> blocked task IDs"""
+
+    def __init__(self):
+        """Initialize an empty graph"""
+        self._successors: Dict[str, List[str]] = {}
+        self.edges: List[Tuple[str, str]] = []
+        self.dangling: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable) -> "DependencyGraph":
+        """Build the graph from parsed tasks (anything with ``id`` and ``dependencies``)"""
+        graph = cls()
+        tasks = list(tasks)
+        for task in tasks:
+            graph._successors.setdefault(task.id, [])
+
+        seen = set()
+        for task in tasks:
+            for dependency in task.dependencies:
+                for blocker in TASK_ID_PATTERN.findall(dependency):
+                    if blocker not in graph._successors:
+                        graph.dangling.setdefault(task.id, []).append(blocker)
+                    elif (blocker, task.id) not in seen:
+                        seen.add((blocker, task.id))
+                        graph._successors[blocker].append(task.id)
+                        graph.edges.append((blocker, task.id))
+        return graph
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of tasks that depend on each other, directly or transitively"""
+        return [
+            component for component in self._strongly_connected()
+            if len(component) > 1 or component[0] in self._successors[component[0]]
+        ]
+
+    def waves(self) -> List[List[Tuple[str, str]]]:
+        """Edges outside cycles, grouped into topological waves"""
+        cycle_of = {task_id: index for index, cycle in enumerate(self.cycles()) for task_id in cycle}
+        edges = [
+            (blocker, blocked) for blocker, blocked in self.edges
+            if blocker not in cycle_of or cycle_of[blocker] != cycle_of.get(blocked)
+        ]
+
+        # Kahn's algorithm; without cycle edges the graph is acyclic
+        successors: Dict[str, List[str]] = {task_id: [] for task_id in self._successors}
+        in_degree = {task_id: 0 for task_id in self._successors}
+        for blocker, blocked in edges:
+            successors[blocker].append(blocked)
+            in_degree[blocked] += 1
+
+        level = {task_id: 0 for task_id, degree in in_degree.items() if degree == 0}
+        ready = list(level)
+        while ready:
+            task_id = ready.pop()
+            for blocked in successors[task_id]:
+                level[blocked] = max(level.get(blocked, 0), level[task_id] + 1)
+                in_degree[blocked] -= 1
+                if in_degree[blocked] == 0:
+                    ready.append(blocked)
+
+        waves: List[List[Tuple[str, str]]] = []
+        for blocker, blocked in edges:
+            while len(waves) <= level[blocker]:
+                waves.append([])
+            waves[level[blocker]].append((blocker, blocked))
+        return [wave for wave in waves if wave]
+
+    def _strongly_connected(self) -> List[List[str]]:
+        """Strongly connected components (iterative Tarjan)"""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
+        components = []
+
+        for root in self._successors:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._successors[root]))]
+
+            while work:
+                node, successors = work[-1]
+                descended = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self._successors[successor])))
+                        descended = True
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], index[successor])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+
+        return components
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+EAIO Task Index
+Lookup of every parsed task by ID, assignee and priority
+
+Built once over all parsed sprints. Each task ID maps to its sprint, its
+epic, the file and line its header is on (recorded by the parser, so no
+file is read again) and, once known, its Jira key;
+assignees (each role of "Data Engineer + ML Engineer" separately) and
+priorities map to their tasks. Lookups never scan the sprint lists.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Separators between the roles of a shared assignment
+_ASSIGNEE_SEPARATORS = re.compile(r'\s*(?:\+|,|/|&|\band\b)\s*')
+
+
+@dataclass
+class TaskEntry:
+    """Where a task lives in the plan and in Jira"""
+    task: object
+    sprint_number: int
+    epic: object
+    source_file: Optional[str] = None
+    source_line: Optional[int] = None
+    jira_key: Optional[str] = None
+
+    @property
+    def location(self) -> str:
+        """'sprint_3.md:120', or the sprint number when the source is unknown"""
+        if self.source_file and self.source_line:
+            return f"{self.source_file}:{self.source_line}"
+        return f"Sprint {self.sprint_number}"
+
+
+def _assignee_roles(assignee: str) -> List[str]:
+    """Normalized roles of an assignment"""
+    return [role.lower() for role in _ASSIGNEE_SEPARATORS.split(assignee or "") if role]
+
+
+class TaskIndex:
+    """Tasks of all sprints by ID, assignee role and priority"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._by_id: Dict[str, TaskEntry] = {}
+        self._by_assignee: Dict[str, List[str]] = {}
+        self._by_priority: Dict[str, List[str]] = {}
+
+    @classmethod
+    def build(cls, sprints: Iterable[Tuple[object, Optional[Path]]],
+              jira_keys: Optional[Mapping[str, str]] = None) -> "TaskIndex":
+        """Index ``(sprint, source_file)`` pairs; ``jira_keys`` maps task IDs already in Jira"""
+        index = cls()
+        jira_keys = jira_keys or {}
+        for sprint, source_file in sprints:
+            for epic in sprint.epics:
+                for task in epic.tasks:
+                    index.add(TaskEntry(
+                        task=task,
+                        sprint_number=sprint.number,
+                        epic=epic,
+                        source_file=Path(source_file).name if source_file is not None else None,
+                        source_line=getattr(task, 'source_line', None),
+                        jira_key=jira_keys.get(task.id),
+                    ))
+        return index
+
+    def add(self, entry: TaskEntry):
+        """Index a task; the first task seen with an ID wins"""
+        task_id = entry.task.id
+        if task_id in self._by_id:
+            return
+        self._by_id[task_id] = entry
+        for role in _assignee_roles(entry.task.assignee):
+            self._by_assignee.setdefault(role, []).append(task_id)
+        self._by_priority.setdefault(entry.task.priority.lower(), []).append(task_id)
+
+    def remove(self, task_id: str):
+        """Drop a task (e.g. removed while customizing an epic)"""
+        entry = self._by_id.pop(task_id, None)
+        if entry is None:
+            return
+        for role in _assignee_roles(entry.task.assignee):
+            self._by_assignee[role].remove(task_id)
+        self._by_priority[entry.task.priority.lower()].remove(task_id)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._by_id
+
+    def get(self, task_id: str) -> Optional[TaskEntry]:
+        """Entry of a task ID"""
+        return self._by_id.get(task_id)
+
+    def jira_key(self, task_id: str) -> Optional[str]:
+        """Jira key of a task, if it has been created"""
+        entry = self._by_id.get(task_id)
+        return entry.jira_key if entry else None
+
+    def set_jira_key(self, task_id: str, jira_key: str):
+        """Record the Jira key of an indexed task"""
+        entry = self._by_id.get(task_id)
+        if entry is not None:
+            entry.jira_key = jira_key
+
+    def by_assignee(self, role: str) -> List[TaskEntry]:
+        """Tasks assigned (possibly jointly) to a role, case-insensitive"""
+        return [self._by_id[task_id] for task_id in self._by_assignee.get(role.strip().lower(), [])]
+
+    def by_priority(self, priority: str) -> List[TaskEntry]:
+        """Tasks with a priority, case-insensitive"""
+        return [self._by_id[task_id] for task_id in self._by_priority.get(priority.strip().lower(), [])]
+
+    def select(self, selectors: Iterable[str]) -> List[TaskEntry]:
+        """Tasks matching any selector: a task ID, 'assignee=<role>' or 'priority=<level>'"""
+        selected: Dict[str, TaskEntry] = {}
+        for selector in selectors:
+            selector = selector.strip()
+            key, _, value = selector.partition("=")
+            if key == "assignee":
+                entries = self.by_assignee(value)
+            elif key == "priority":
+                entries = self.by_priority(value)
+            else:
+                entries = [self._by_id[selector]] if selector in self._by_id else []
+            for entry in entries:
+                selected.setdefault(entry.task.id, entry)
+        return list(selected.values())